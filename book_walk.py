@@ -0,0 +1,69 @@
+"""
+Bid-Side Book Walk Helpers
+==========================
+Pure sizing/pricing math for selling into a best-first bid book, shared by the
+hard stop and the exit bid walk in trading_bot_smart.py.
+
+Levels are best-first (price, size) float tuples, as built by parse_levels().
+"""
+
+
+def parse_levels(levels):
+    """Convert book levels to (price, size) float tuples once, keeping order."""
+    return [(float(lvl['price']), float(lvl.get('size') or 0)) for lvl in levels]
+
+
+def bid_vwap(levels, shares):
+    """VWAP for selling `shares` into best-first (price, size) `levels`."""
+    left = shares
+    notional = 0.0
+    for price, size in levels:
+        take = min(size, left)
+        notional += take * price
+        left -= take
+        if left <= 0:
+            break
+    filled = shares - left
+    return notional / filled if filled > 0 else 0.0
+
+
+def build_chunk_plan(levels, remaining_shares, max_chunk_frac=0.9):
+    """
+    Size the next FOK chunk from cumulative bid depth.
+
+    Args:
+        levels: Best-first bid levels as (price, size) from parse_levels()
+        remaining_shares: Shares still to liquidate
+        max_chunk_frac: Fraction of visible depth one FOK may take
+
+    Returns:
+        tuple: (chunk_size, expected_vwap, total_depth)
+    """
+    total_depth = sum(size for _, size in levels)
+    chunk_size = min(remaining_shares, max(total_depth * max_chunk_frac, 1))  # min 1 share
+    return chunk_size, bid_vwap(levels, chunk_size), total_depth
+
+
+def plan_bid_walk(levels, shares, min_price=0.0):
+    """
+    Split `shares` across best-first bid levels, one chunk per level.
+
+    Args:
+        levels: Best-first bid levels as (price, size) from parse_levels()
+        shares: Shares to place
+        min_price: Stop at the first level priced below this
+
+    Returns:
+        list: (price, chunk) pairs covering up to `shares`, skipping empty levels
+    """
+    plans = []
+    left = shares
+    for price, size in levels:
+        if left <= 0 or price < min_price:
+            break
+        if size <= 0:
+            continue
+        chunk = size if size < left else left
+        plans.append((price, chunk))
+        left -= chunk
+    return plans
@@ -0,0 +1,214 @@
+"""
+Polymarket CLOB Live Order Book Feed
+====================================
+Maintains in-memory L2 books for the current window's UP/DOWN tokens from the
+CLOB market WebSocket, so exit paths can read the book without a REST round trip.
+
+WebSocket: wss://ws-subscriptions-clob.polymarket.com/ws/market
+Events: book (full snapshot), price_change (level deltas)
+"""
+
+import asyncio
+import json
+import time
+from threading import Thread, Event, Lock, Condition
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    print("WARNING: websockets package not installed. Run: pip3 install websockets")
+
+
+class ClobBookFeed:
+    """Live UP/DOWN order books from the Polymarket CLOB market channel."""
+
+    WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    PING_INTERVAL = 10  # seconds
+    STALE_SECONDS = 5   # Books older than this are not served
+
+    def __init__(self):
+        self._books = {}         # token_id -> {"bids": {price: size}, "asks": {price: size}} (floats)
+        self._depth = {}         # token_id -> [bid notional, ask notional], kept in step with deltas
+        self._last_update = {}   # token_id -> time of last snapshot/delta
+        self._tokens = ()        # (up_token, down_token) currently subscribed
+        self._lock = Lock()
+        self._changed = Condition(self._lock)  # Notified on every applied event
+        self._version = 0
+        self._token_version = {}  # token_id -> count of applied events for that book
+        self._stop_event = Event()
+        self._resubscribe = Event()
+        self._thread = None
+        self._connected = False
+
+    def start(self):
+        """Start WebSocket connection in background daemon thread."""
+        if not WEBSOCKETS_AVAILABLE:
+            print("[BOOK_WS] Cannot start - websockets package not installed")
+            return False
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True, name="CLOB-Book-Feed")
+        self._thread.start()
+        print("[BOOK_WS] Starting WebSocket connection...")
+        return True
+
+    def track(self, up_token, down_token):
+        """Follow a new pair of tokens (no-op if already subscribed)."""
+        tokens = (up_token, down_token)
+        if tokens == self._tokens:
+            return
+        with self._lock:
+            self._tokens = tokens
+            self._books = {}
+            self._depth = {}
+            self._last_update = {}
+            self._token_version = {}
+        self._resubscribe.set()
+
+    def _run_loop(self):
+        """Run asyncio event loop in background thread."""
+        asyncio.run(self._connect())
+
+    async def _connect(self):
+        """Connect to the market channel and apply book events."""
+        while not self._stop_event.is_set():
+            tokens = self._tokens
+            if not all(tokens):
+                await asyncio.sleep(0.5)
+                continue
+
+            try:
+                async with websockets.connect(
+                    self.WS_URL,
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=10
+                ) as ws:
+                    self._resubscribe.clear()
+                    await ws.send(json.dumps({"assets_ids": list(tokens), "type": "market"}))
+                    self._connected = True
+                    print(f"[BOOK_WS] Subscribed to {tokens[0][:8]}.../{tokens[1][:8]}...")
+
+                    while not self._stop_event.is_set() and not self._resubscribe.is_set():
+                        try:
+                            msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+
+                        if not msg or msg == "PONG":
+                            continue
+
+                        try:
+                            data = json.loads(msg)
+                        except json.JSONDecodeError:
+                            continue
+
+                        for event in (data if isinstance(data, list) else [data]):
+                            self._handle_event(event)
+
+            except Exception as e:
+                self._connected = False
+                if not self._stop_event.is_set():
+                    print(f"[BOOK_WS] Connection error: {e}, reconnecting in 2s...")
+                    await asyncio.sleep(2)
+
+    def _handle_event(self, event):
+        """Apply a book snapshot or price_change delta."""
+        event_type = event.get("event_type")
+        now = time.time()
+
+        with self._lock:
+            if event_type == "book":
+                token = event.get("asset_id")
+                if token not in self._tokens:
+                    return
+                bids = event.get("bids", event.get("buys", []))
+                asks = event.get("asks", event.get("sells", []))
+                # Levels are parsed to floats once here, not on every snapshot/read
+                book = self._books[token] = {
+                    "bids": {float(lvl["price"]): float(lvl["size"]) for lvl in bids},
+                    "asks": {float(lvl["price"]): float(lvl["size"]) for lvl in asks},
+                }
+                self._depth[token] = [sum(p * s for p, s in book["bids"].items()),
+                                      sum(p * s for p, s in book["asks"].items())]
+                self._last_update[token] = now
+                self._token_version[token] = self._token_version.get(token, 0) + 1
+
+            elif event_type == "price_change":
+                # Newer payloads carry asset_id per change; older ones at the top level
+                changes = event.get("price_changes") or event.get("changes", [])
+                for change in changes:
+                    token = change.get("asset_id", event.get("asset_id"))
+                    book = self._books.get(token)
+                    if book is None:
+                        continue  # No snapshot yet - deltas are meaningless
+                    is_bid = change.get("side") == "BUY"
+                    levels = book["bids"] if is_bid else book["asks"]
+                    price = float(change["price"])
+                    size = float(change.get("size", 0))
+                    if size == 0:
+                        old = levels.pop(price, 0.0)
+                    else:
+                        old = levels.get(price, 0.0)
+                        levels[price] = size
+                    # Running notional: only the changed level moves the side's total
+                    self._depth[token][0 if is_bid else 1] += (size - old) * price
+                    self._last_update[token] = now
+                    self._token_version[token] = self._token_version.get(token, 0) + 1
+            else:
+                return
+
+            self._version += 1
+            self._changed.notify_all()
+
+    def wait_for_update(self, timeout, token=None):
+        """Block until the next book event is applied or `timeout` elapses.
+
+        Args:
+            timeout: Max seconds to wait
+            token: If given, only wake for changes to this token's book
+
+        Returns:
+            bool: True if the book changed, False on timeout
+        """
+        with self._changed:
+            if token is None:
+                seen = self._version
+                return self._changed.wait_for(lambda: self._version != seen, timeout)
+            seen = self._token_version.get(token, 0)
+            return self._changed.wait_for(lambda: self._token_version.get(token, 0) != seen, timeout)
+
+    def snapshot(self, up_token, down_token):
+        """
+        Return books in get_order_books() format, or None if not live/fresh.
+
+        Levels are best-first: asks ascending, bids descending. Prices and sizes
+        are floats, as in the bot's REST books. Also carries each side's running
+        notional as {up,down}_{bid,ask}_depth for OrderBookAnalyzer.
+        """
+        if not self._connected or (up_token, down_token) != self._tokens:
+            return None
+
+        now = time.time()
+        result = {'up_token': up_token, 'down_token': down_token}
+        with self._lock:
+            for prefix, token in (("up", up_token), ("down", down_token)):
+                book = self._books.get(token)
+                if book is None or now - self._last_update.get(token, 0) > self.STALE_SECONDS:
+                    return None
+                result[f'{prefix}_asks'] = [{'price': p, 'size': s} for p, s in sorted(book["asks"].items())]
+                result[f'{prefix}_bids'] = [{'price': p, 'size': s} for p, s in
+                                            sorted(book["bids"].items(), reverse=True)]
+                result[f'{prefix}_bid_depth'], result[f'{prefix}_ask_depth'] = self._depth[token]
+        return result
+
+    def is_connected(self):
+        """Check if WebSocket is connected."""
+        return self._connected
+
+    def stop(self):
+        """Stop the WebSocket connection."""
+        self._stop_event.set()
+        self._connected = False
+        print("[BOOK_WS] Stopped")
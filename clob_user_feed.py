@@ -0,0 +1,224 @@
+"""
+Polymarket CLOB User Order Feed
+===============================
+Tracks fills on our own orders from the authenticated CLOB user WebSocket, so
+order paths can wake the moment an order matches instead of sleeping between
+REST status polls.
+
+WebSocket: wss://ws-subscriptions-clob.polymarket.com/ws/user
+Events: order (PLACEMENT / UPDATE / CANCELLATION), trade (MATCHED ...)
+"""
+
+import asyncio
+import json
+from threading import Thread, Event, Lock, Condition
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    print("WARNING: websockets package not installed. Run: pip3 install websockets")
+
+
+class ClobUserFeed:
+    """Fill state for our orders from the Polymarket CLOB user channel."""
+
+    WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+    PING_INTERVAL = 10  # seconds
+    MAX_ORDERS = 500    # Forget the oldest orders beyond this many
+
+    def __init__(self):
+        self._orders = {}        # order_id -> {"filled": float, "original": float, "cancelled": bool}
+        self._lock = Lock()
+        self._changed = Condition(self._lock)  # Notified on every order/trade event
+        self._order_version = {}  # order_id -> count of events touching that order
+        self._creds = None
+        self._stop_event = Event()
+        self._thread = None
+        self._connected = False
+
+    def start(self, creds):
+        """Start WebSocket connection in background daemon thread.
+
+        Args:
+            creds: py_clob_client ApiCreds (api_key, api_secret, api_passphrase)
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            print("[USER_WS] Cannot start - websockets package not installed")
+            return False
+        if creds is None:
+            print("[USER_WS] Cannot start - no API credentials")
+            return False
+
+        self._creds = creds
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True, name="CLOB-User-Feed")
+        self._thread.start()
+        print("[USER_WS] Starting WebSocket connection...")
+        return True
+
+    def _run_loop(self):
+        """Run asyncio event loop in background thread."""
+        asyncio.run(self._connect())
+
+    async def _connect(self):
+        """Connect to the user channel and apply order/trade events."""
+        while not self._stop_event.is_set():
+            try:
+                async with websockets.connect(
+                    self.WS_URL,
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=10
+                ) as ws:
+                    await ws.send(json.dumps({
+                        "auth": {
+                            "apiKey": self._creds.api_key,
+                            "secret": self._creds.api_secret,
+                            "passphrase": self._creds.api_passphrase,
+                        },
+                        "type": "user",
+                    }))
+                    self._connected = True
+                    print("[USER_WS] Subscribed to user channel")
+
+                    while not self._stop_event.is_set():
+                        try:
+                            msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+
+                        if not msg or msg == "PONG":
+                            continue
+
+                        try:
+                            data = json.loads(msg)
+                        except json.JSONDecodeError:
+                            continue
+
+                        for event in (data if isinstance(data, list) else [data]):
+                            self._handle_event(event)
+
+            except Exception as e:
+                self._connected = False
+                if not self._stop_event.is_set():
+                    print(f"[USER_WS] Connection error: {e}, reconnecting in 2s...")
+                    await asyncio.sleep(2)
+
+    def _handle_event(self, event):
+        """Record an order update, or wake waiters on a trade touching our orders."""
+        event_type = event.get("event_type")
+
+        with self._lock:
+            if event_type == "order":
+                order_id = event.get("id")
+                if not order_id:
+                    return
+                prev = self._orders.get(order_id)
+                # An update without original_size keeps the size we already know (0 = unknown)
+                original = float(event.get("original_size") or 0) or (prev["original"] if prev else 0.0)
+                self._orders[order_id] = {
+                    "filled": float(event.get("size_matched") or 0),
+                    "original": original,
+                    "cancelled": event.get("type") == "CANCELLATION",
+                }
+                if len(self._orders) > self.MAX_ORDERS:
+                    del self._orders[next(iter(self._orders))]
+                touched = [order_id]
+            elif event_type == "trade":
+                # Trades carry no cumulative fill size - the matching order event does,
+                # but waking here lets callers confirm via REST without waiting for it.
+                touched = [event.get("taker_order_id")]
+                touched += [m.get("order_id") for m in event.get("maker_orders") or []]
+            else:
+                return
+
+            for order_id in touched:
+                if order_id:
+                    self._order_version[order_id] = self._order_version.get(order_id, 0) + 1
+            while len(self._order_version) > self.MAX_ORDERS:
+                del self._order_version[next(iter(self._order_version))]
+            self._changed.notify_all()
+
+    @staticmethod
+    def _state_done(state):
+        """True if an order state is cancelled, or fully filled against a known size."""
+        if state is None:
+            return False
+        return state["cancelled"] or 0 < state["original"] <= state["filled"]
+
+    def _done(self, order_ids):
+        """True if every order is fully filled or cancelled (lock held)."""
+        return all(self._state_done(self._orders.get(order_id)) for order_id in order_ids)
+
+    def wait_for_fills(self, order_ids, timeout):
+        """Block until an order or trade event touches one of `order_ids`, or `timeout` elapses.
+
+        Returns immediately if every order in `order_ids` is already done.
+
+        Returns:
+            bool: True if woken by an event (or already done), False on timeout
+        """
+        versions = self._order_version
+        with self._changed:
+            if self._done(order_ids):
+                return True
+            seen = [versions.get(order_id, 0) for order_id in order_ids]
+            return self._changed.wait_for(
+                lambda: [versions.get(order_id, 0) for order_id in order_ids] != seen, timeout)
+
+    def wait_for_order(self, order_id, timeout, until_done=False):
+        """Block until an event has been seen for `order_id`, or `timeout` elapses.
+
+        Args:
+            order_id: Order to wait on
+            timeout: Max seconds to wait
+            until_done: If True, wait until the order is fully filled or cancelled
+
+        Returns:
+            bool: True if the condition was met, False on timeout
+        """
+        def ready():
+            state = self._orders.get(order_id)
+            if state is None:
+                return False
+            return not until_done or self._state_done(state)
+
+        with self._changed:
+            return self._changed.wait_for(ready, timeout)
+
+    def get_order(self, order_id):
+        """Last known fill state for an order, or None if no event seen yet."""
+        with self._lock:
+            state = self._orders.get(order_id)
+            return dict(state) if state else None
+
+    def order_status(self, order_id):
+        """
+        get_order_status()-shaped view of the last event for an order.
+
+        Returns None if no event has been seen, or if the order's size is still
+        unknown (no original_size yet) - callers fall back to REST.
+        """
+        state = self.get_order(order_id)
+        if state is None:
+            return None
+        filled, original = state["filled"], state["original"]
+        if state["cancelled"]:
+            status = "CANCELED"
+        elif original <= 0:
+            return None
+        else:
+            status = "MATCHED" if filled >= original else "LIVE"
+        return {"filled": filled, "original": original, "is_filled": filled > 0,
+                "fully_filled": original > 0 and filled >= original, "price": 0, "status": status}
+
+    def is_connected(self):
+        """Check if WebSocket is connected."""
+        return self._connected
+
+    def stop(self):
+        """Stop the WebSocket connection."""
+        self._stop_event.set()
+        self._connected = False
+        print("[USER_WS] Stopped")
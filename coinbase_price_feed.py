@@ -0,0 +1,116 @@
+"""
+Coinbase BTC-USD Ticker Feed
+============================
+Streams the Coinbase BTC-USD last-trade price so strategy signals read a cached
+price instead of making an HTTPS request per tick. Same exchange and product as
+the bot's REST fallback, so switching between the two doesn't shift the series.
+
+WebSocket: wss://ws-feed.exchange.coinbase.com
+Channel: ticker (BTC-USD)
+"""
+
+import asyncio
+import json
+import time
+from threading import Thread, Event
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    print("WARNING: websockets package not installed. Run: pip3 install websockets")
+
+
+class CoinbasePriceFeed:
+    """Live BTC-USD price from the Coinbase Exchange ticker channel."""
+
+    WS_URL = "wss://ws-feed.exchange.coinbase.com"
+    PRODUCT_ID = "BTC-USD"
+    PING_INTERVAL = 10  # seconds
+    STALE_SECONDS = 10  # Prices older than this are not served
+
+    def __init__(self):
+        self.current_price = None
+        self.last_update = 0
+        self._stop_event = Event()
+        self._thread = None
+        self._connected = False
+
+    def start(self):
+        """Start WebSocket connection in background daemon thread."""
+        if not WEBSOCKETS_AVAILABLE:
+            print("[CB_WS] Cannot start - websockets package not installed")
+            return False
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run_loop, daemon=True, name="Coinbase-Price-Feed")
+        self._thread.start()
+        print("[CB_WS] Starting WebSocket connection...")
+        return True
+
+    def _run_loop(self):
+        """Run asyncio event loop in background thread."""
+        asyncio.run(self._connect())
+
+    async def _connect(self):
+        """Subscribe to the ticker channel and keep the latest price."""
+        while not self._stop_event.is_set():
+            try:
+                async with websockets.connect(
+                    self.WS_URL,
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=10
+                ) as ws:
+                    await ws.send(json.dumps({
+                        "type": "subscribe",
+                        "channels": [{"name": "ticker", "product_ids": [self.PRODUCT_ID]}],
+                    }))
+                    self._connected = True
+                    print(f"[CB_WS] Subscribed to {self.PRODUCT_ID} ticker")
+
+                    while not self._stop_event.is_set():
+                        try:
+                            msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+
+                        try:
+                            data = json.loads(msg)
+                        except json.JSONDecodeError:
+                            continue
+
+                        self._handle_message(data)
+
+            except Exception as e:
+                self._connected = False
+                if not self._stop_event.is_set():
+                    print(f"[CB_WS] Connection error: {e}, reconnecting in 2s...")
+                    await asyncio.sleep(2)
+
+    def _handle_message(self, data):
+        """Record the price from a ticker message."""
+        if data.get("type") != "ticker" or data.get("product_id") != self.PRODUCT_ID:
+            return
+        price = data.get("price")
+        if price:
+            self.current_price = float(price)
+            self.last_update = time.time()
+
+    def get_price(self):
+        """Latest price, or None if not connected or stale."""
+        if not self.is_connected():
+            return None
+        return self.current_price
+
+    def is_connected(self):
+        """Check if WebSocket is connected and receiving data."""
+        if not self._connected:
+            return False
+        return (time.time() - self.last_update) < self.STALE_SECONDS
+
+    def stop(self):
+        """Stop the WebSocket connection."""
+        self._stop_event.set()
+        self._connected = False
+        print("[CB_WS] Stopped")
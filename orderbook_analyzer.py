@@ -11,6 +11,7 @@ ride that momentum and buy that side.
 import time
 import requests
 from collections import deque
+from itertools import islice
 
 
 class OrderBookAnalyzer:
@@ -39,16 +40,45 @@ class OrderBookAnalyzer:
             float: Imbalance score from -1.0 (all sellers) to +1.0 (all buyers)
         """
         # Calculate total value on each side
-        bid_depth = sum(float(b.get('size', 0)) * float(b.get('price', 0)) for b in bids)
-        ask_depth = sum(float(a.get('size', 0)) * float(a.get('price', 0)) for a in asks)
+        return self._imbalance(self._depth(bids), self._depth(asks))
 
+    def side_imbalance(self, books, side):
+        """
+        Imbalance for one side of a bot books dict.
+
+        Uses the live feed's running notionals ({side}_bid_depth / {side}_ask_depth)
+        when present, so the levels aren't summed again; REST books fall back to
+        summing the level lists.
+
+        Args:
+            books: books dict from get_order_books() / ClobBookFeed.snapshot()
+            side: 'up' or 'down'
+        """
+        bid_depth = books.get(f'{side}_bid_depth')
+        ask_depth = books.get(f'{side}_ask_depth')
+        if bid_depth is None or ask_depth is None:
+            bid_depth = self._depth(books.get(f'{side}_bids', []))
+            ask_depth = self._depth(books.get(f'{side}_asks', []))
+        return self._imbalance(bid_depth, ask_depth)
+
+    @staticmethod
+    def _imbalance(bid_depth, ask_depth):
+        """(bid - ask) / (bid + ask) notional, rounded; 0.0 for an empty book."""
         total = bid_depth + ask_depth
-        if total == 0:
+        if total <= 0:
             return 0.0
 
         imbalance = (bid_depth - ask_depth) / total
         return round(imbalance, 3)
 
+    @staticmethod
+    def _depth(levels):
+        """Total notional (size * price) across a list of book levels."""
+        depth = 0.0
+        for lvl in levels:
+            depth += float(lvl.get('size', 0)) * float(lvl.get('price', 0))
+        return depth
+
     def analyze(self, up_bids, up_asks, down_bids, down_asks):
         """
         Analyze both UP and DOWN order books.
@@ -56,9 +86,16 @@ class OrderBookAnalyzer:
         Returns:
             dict with imbalance scores and trading signal
         """
-        up_imbalance = self.calculate_imbalance(up_bids, up_asks)
-        down_imbalance = self.calculate_imbalance(down_bids, down_asks)
+        return self._analyze(self.calculate_imbalance(up_bids, up_asks),
+                             self.calculate_imbalance(down_bids, down_asks))
 
+    def analyze_books(self, books):
+        """analyze() for a bot books dict, reusing the live feed's running depths."""
+        return self._analyze(self.side_imbalance(books, 'up'),
+                             self.side_imbalance(books, 'down'))
+
+    def _analyze(self, up_imbalance, down_imbalance):
+        """Record a reading and derive signal/trend/strength from it."""
         # Store in history
         reading = {
             'time': time.time(),
@@ -114,10 +151,11 @@ class OrderBookAnalyzer:
         if len(self.history) < min_readings:
             return None
 
-        recent = list(self.history)[-min_readings:]
-
-        up_bullish = sum(1 for r in recent if r['up_imb'] > 0.15)
-        down_bullish = sum(1 for r in recent if r['down_imb'] > 0.15)
+        # Newest min_readings entries, without copying the whole history deque
+        up_bullish = down_bullish = 0
+        for r in islice(reversed(self.history), min_readings):
+            up_bullish += r['up_imb'] > 0.15
+            down_bullish += r['down_imb'] > 0.15
 
         if up_bullish / min_readings >= consistency:
             return "TREND_UP"
@@ -5,6 +5,7 @@ Logs trading ticks to Supabase for real-time analysis.
 """
 
 import os
+import queue
 import threading
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -30,6 +31,7 @@ EVENTS_TABLE = "Polymarket Bot Log - Events"
 
 # Buffer configuration
 TICK_FLUSH_INTERVAL = 30  # Flush every 30 seconds (increased from 10 to reduce API calls)
+UPLOAD_QUEUE_MAX = 100  # Pending batch uploads before new batches are dropped
 
 
 class SupabaseLogger:
@@ -42,6 +44,8 @@ class SupabaseLogger:
         self._activity_buffer: List[Dict] = []
         self._last_flush = datetime.now()
         self._initialized = False
+        self._upload_queue: "queue.Queue" = queue.Queue(maxsize=UPLOAD_QUEUE_MAX)
+        self._upload_thread: Optional[threading.Thread] = None
 
     def init(self) -> bool:
         """Initialize Supabase connection."""
@@ -57,12 +61,38 @@ class SupabaseLogger:
             self.client = create_client(SUPABASE_URL, SUPABASE_KEY)
             self.enabled = True
             self._initialized = True
+            self._upload_thread = threading.Thread(target=self._upload_worker, daemon=True)
+            self._upload_thread.start()
             print(f"[SUPABASE] Connected to Supabase")
             return True
         except Exception as e:
             print(f"[SUPABASE] Failed to connect: {e}")
             return False
 
+    def _upload_worker(self):
+        """Drain queued batch uploads on one long-lived thread.
+
+        A label of None marks a single-event insert: logged only on failure.
+        """
+        while True:
+            table, rows, label = self._upload_queue.get()
+            try:
+                self.client.table(table).insert(rows).execute()
+                if label:
+                    print(f"[SUPABASE] Flushed {len(rows)} {label}")
+            except Exception as e:
+                if label:
+                    print(f"[SUPABASE] Failed to flush {label}: {e}")
+                else:
+                    print(f"[SUPABASE] Failed to log event: {e}")
+
+    def _enqueue_upload(self, table: str, rows, label: Optional[str]):
+        """Hand a batch (or single event row) to the upload thread without blocking the caller."""
+        try:
+            self._upload_queue.put_nowait((table, rows, label))
+        except queue.Full:
+            print(f"[SUPABASE] Upload queue full, dropped {label or 'event'}")
+
     def buffer_tick(self, window_id: str, ttc: float, status: str,
                     ask_up: float, ask_down: float,
                     up_shares: float, down_shares: float,
@@ -100,15 +130,8 @@ class SupabaseLogger:
         self._tick_buffer = []
         self._last_flush = datetime.now()
 
-        # Run the actual upload in a background thread
-        def _do_flush():
-            try:
-                self.client.table(TICKS_TABLE).insert(buffer_copy).execute()
-                print(f"[SUPABASE] Flushed {len(buffer_copy)} ticks")
-            except Exception as e:
-                print(f"[SUPABASE] Failed to flush ticks: {e}")
-
-        threading.Thread(target=_do_flush, daemon=True).start()
+        # Upload happens on the background upload thread
+        self._enqueue_upload(TICKS_TABLE, buffer_copy, "ticks")
         return True
 
     def maybe_flush_ticks(self, ttl: float = None) -> bool:
@@ -155,14 +178,8 @@ class SupabaseLogger:
             "Details": details[:500] if details else None
         }
 
-        # Run in background thread to avoid blocking trading loop
-        def _do_log():
-            try:
-                self.client.table(EVENTS_TABLE).insert(data).execute()
-            except Exception as e:
-                print(f"[SUPABASE] Failed to log event: {e}")
-
-        threading.Thread(target=_do_log, daemon=True).start()
+        # Insert happens on the background upload thread - no thread per event
+        self._enqueue_upload(EVENTS_TABLE, data, None)
         return True
 
     def buffer_activity(self, action: str, window_id: str = "", details: dict = None):
@@ -187,15 +204,8 @@ class SupabaseLogger:
         buffer_copy = self._activity_buffer[:]
         self._activity_buffer = []
 
-        # Run the actual upload in a background thread
-        def _do_flush():
-            try:
-                self.client.table("Polymarket Bot Log - Activity").insert(buffer_copy).execute()
-                print(f"[SUPABASE] Flushed {len(buffer_copy)} activities")
-            except Exception as e:
-                print(f"[SUPABASE] Failed to flush activities: {e}")
-
-        threading.Thread(target=_do_flush, daemon=True).start()
+        # Upload happens on the background upload thread
+        self._enqueue_upload("Polymarket Bot Log - Activity", buffer_copy, "activities")
         return True
 
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the bid-side book walk helpers (hard stop / exit sizing).
+Run: python3 -m pytest test_book_walk.py
+"""
+import pytest
+
+from book_walk import parse_levels, bid_vwap, build_chunk_plan, plan_bid_walk
+
+# Best-first bids: 10 @ 50c, 20 @ 40c, nothing @ 35c, 30 @ 30c
+BIDS = [(0.50, 10.0), (0.40, 20.0), (0.35, 0.0), (0.30, 30.0)]
+
+
+def test_parse_levels():
+    raw = [{'price': '0.5', 'size': '10'}, {'price': 0.4}, {'price': '0.3', 'size': None}]
+    assert parse_levels(raw) == [(0.5, 10.0), (0.4, 0.0), (0.3, 0.0)]
+
+
+def test_bid_vwap_top_level_only():
+    assert bid_vwap(BIDS, 5) == pytest.approx(0.50)
+
+
+def test_bid_vwap_walks_levels():
+    # 10 @ 0.50 + 15 @ 0.40
+    assert bid_vwap(BIDS, 25) == pytest.approx((10 * 0.50 + 15 * 0.40) / 25)
+
+
+def test_bid_vwap_skips_empty_level():
+    # 10 @ 0.50 + 20 @ 0.40 + (0 @ 0.35) + 10 @ 0.30
+    assert bid_vwap(BIDS, 40) == pytest.approx((5.0 + 8.0 + 3.0) / 40)
+
+
+def test_bid_vwap_beyond_depth_prices_what_fills():
+    assert bid_vwap(BIDS, 1000) == pytest.approx((5.0 + 8.0 + 9.0) / 60)
+
+
+def test_bid_vwap_empty_book():
+    assert bid_vwap([], 10) == 0.0
+
+
+def test_build_chunk_plan_caps_at_depth_fraction():
+    chunk, vwap, depth = build_chunk_plan(BIDS, 100)
+    assert depth == 60
+    assert chunk == pytest.approx(54)  # 90% of 60
+    assert vwap == pytest.approx(bid_vwap(BIDS, 54))
+
+
+def test_build_chunk_plan_remaining_below_cap():
+    chunk, vwap, _ = build_chunk_plan(BIDS, 8)
+    assert chunk == 8
+    assert vwap == pytest.approx(0.50)
+
+
+def test_build_chunk_plan_min_one_share():
+    chunk, _, depth = build_chunk_plan([(0.20, 0.5)], 10)
+    assert depth == 0.5
+    assert chunk == 1
+
+
+def test_plan_bid_walk_one_chunk_per_level():
+    assert plan_bid_walk(BIDS, 35) == [(0.50, 10.0), (0.40, 20.0), (0.30, 5.0)]
+
+
+def test_plan_bid_walk_min_price_cutoff():
+    assert plan_bid_walk(BIDS, 100, min_price=0.40) == [(0.50, 10.0), (0.40, 20.0)]
+
+
+def test_plan_bid_walk_stops_when_covered():
+    assert plan_bid_walk(BIDS, 10) == [(0.50, 10.0)]
+
+
+def test_plan_bid_walk_nothing_to_place():
+    assert plan_bid_walk(BIDS, 0) == []
+    assert plan_bid_walk([], 10) == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for ClobBookFeed snapshot/delta handling (no WebSocket needed).
+Run: python3 -m pytest test_clob_book_feed.py
+"""
+import time
+
+import pytest
+
+from clob_book_feed import ClobBookFeed
+
+UP, DOWN = "up-token", "down-token"
+
+
+def make_feed():
+    """Feed tracking UP/DOWN with a book snapshot applied to each."""
+    feed = ClobBookFeed()
+    feed.track(UP, DOWN)
+    feed._connected = True  # Normally set by the WebSocket loop
+    feed._handle_event({
+        "event_type": "book", "asset_id": UP,
+        "bids": [{"price": "0.40", "size": "100"}, {"price": "0.45", "size": "50"}],
+        "asks": [{"price": "0.55", "size": "20"}, {"price": "0.50", "size": "10"}],
+    })
+    feed._handle_event({
+        "event_type": "book", "asset_id": DOWN,
+        "buys": [{"price": "0.48", "size": "30"}],
+        "sells": [{"price": "0.52", "size": "40"}],
+    })
+    return feed
+
+
+def price_change(token, side, price, size):
+    return {"event_type": "price_change",
+            "price_changes": [{"asset_id": token, "side": side, "price": price, "size": size}]}
+
+
+def test_snapshot_is_best_first_floats():
+    snap = make_feed().snapshot(UP, DOWN)
+    assert snap['up_bids'] == [{'price': 0.45, 'size': 50.0}, {'price': 0.40, 'size': 100.0}]
+    assert snap['up_asks'] == [{'price': 0.50, 'size': 10.0}, {'price': 0.55, 'size': 20.0}]
+    assert snap['down_bids'] == [{'price': 0.48, 'size': 30.0}]
+    assert snap['down_asks'] == [{'price': 0.52, 'size': 40.0}]
+
+
+def test_snapshot_depth():
+    snap = make_feed().snapshot(UP, DOWN)
+    assert snap['up_bid_depth'] == pytest.approx(0.45 * 50 + 0.40 * 100)
+    assert snap['up_ask_depth'] == pytest.approx(0.50 * 10 + 0.55 * 20)
+    assert snap['down_bid_depth'] == pytest.approx(0.48 * 30)
+
+
+def test_delta_updates_level_and_depth():
+    feed = make_feed()
+    feed._handle_event(price_change(UP, "BUY", "0.40", "60"))
+    snap = feed.snapshot(UP, DOWN)
+    assert snap['up_bids'][1] == {'price': 0.40, 'size': 60.0}
+    assert snap['up_bid_depth'] == pytest.approx(0.45 * 50 + 0.40 * 60)
+
+
+def test_delta_adds_new_level():
+    feed = make_feed()
+    feed._handle_event(price_change(UP, "SELL", "0.49", "5"))
+    snap = feed.snapshot(UP, DOWN)
+    assert snap['up_asks'][0] == {'price': 0.49, 'size': 5.0}
+    assert snap['up_ask_depth'] == pytest.approx(0.49 * 5 + 0.50 * 10 + 0.55 * 20)
+
+
+def test_zero_size_delta_removes_level():
+    feed = make_feed()
+    feed._handle_event(price_change(UP, "BUY", "0.45", "0"))
+    snap = feed.snapshot(UP, DOWN)
+    assert snap['up_bids'] == [{'price': 0.40, 'size': 100.0}]
+    assert snap['up_bid_depth'] == pytest.approx(0.40 * 100)
+
+
+def test_zero_size_delta_for_missing_level_is_noop():
+    feed = make_feed()
+    feed._handle_event(price_change(UP, "BUY", "0.10", "0"))
+    snap = feed.snapshot(UP, DOWN)
+    assert len(snap['up_bids']) == 2
+    assert snap['up_bid_depth'] == pytest.approx(0.45 * 50 + 0.40 * 100)
+
+
+def test_legacy_top_level_asset_id():
+    feed = make_feed()
+    feed._handle_event({"event_type": "price_change", "asset_id": DOWN,
+                        "changes": [{"side": "SELL", "price": "0.52", "size": "0"}]})
+    snap = feed.snapshot(UP, DOWN)
+    assert snap['down_asks'] == []
+    assert snap['down_ask_depth'] == pytest.approx(0.0)
+
+
+def test_delta_before_snapshot_is_ignored():
+    feed = ClobBookFeed()
+    feed.track(UP, DOWN)
+    feed._connected = True
+    feed._handle_event(price_change(UP, "BUY", "0.40", "10"))
+    assert feed.snapshot(UP, DOWN) is None
+
+
+def test_snapshot_for_untracked_tokens_or_stale_book():
+    feed = make_feed()
+    assert feed.snapshot(UP, "other-token") is None
+    feed._last_update[DOWN] = time.time() - ClobBookFeed.STALE_SECONDS - 1
+    assert feed.snapshot(UP, DOWN) is None
+
+
+def test_token_version_counts_per_book():
+    feed = make_feed()
+    feed._handle_event(price_change(UP, "BUY", "0.41", "1"))
+    assert feed.wait_for_update(0, token=UP) is False  # Nothing new since the call
+    assert feed._token_version[UP] == 2
+    assert feed._token_version[DOWN] == 1
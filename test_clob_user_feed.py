@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for ClobUserFeed order/trade event handling (no WebSocket needed).
+Run: python3 -m pytest test_clob_user_feed.py
+"""
+import threading
+import time
+
+from clob_user_feed import ClobUserFeed
+
+
+def order_event(order_id, matched, original="10", kind="UPDATE"):
+    event = {"event_type": "order", "id": order_id, "size_matched": matched, "type": kind}
+    if original is not None:
+        event["original_size"] = original
+    return event
+
+
+def later(delay, fn, *args):
+    """Run fn(*args) on a timer thread, as the WebSocket thread would."""
+    timer = threading.Timer(delay, fn, args)
+    timer.start()
+    return timer
+
+
+def test_order_event_records_state():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "4", "10", "PLACEMENT"))
+    assert feed.get_order("a") == {"filled": 4.0, "original": 10.0, "cancelled": False}
+    assert feed.get_order("missing") is None
+
+
+def test_cancellation_event():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "2", "10", "CANCELLATION"))
+    assert feed.get_order("a")["cancelled"] is True
+
+
+def test_update_without_original_size_keeps_known_size():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "0", "10", "PLACEMENT"))
+    feed._handle_event(order_event("a", "3", None))
+    assert feed.get_order("a") == {"filled": 3.0, "original": 10.0, "cancelled": False}
+
+
+def test_orders_capped_at_max():
+    feed = ClobUserFeed()
+    for i in range(ClobUserFeed.MAX_ORDERS + 5):
+        feed._handle_event(order_event(f"o{i}", "0"))
+    assert feed.get_order("o0") is None
+    assert feed.get_order(f"o{ClobUserFeed.MAX_ORDERS + 4}") is not None
+    assert len(feed._order_version) <= ClobUserFeed.MAX_ORDERS
+
+
+def test_order_status_shapes():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("live", "4"))
+    feed._handle_event(order_event("full", "10"))
+    feed._handle_event(order_event("gone", "2", kind="CANCELLATION"))
+    assert feed.order_status("live") == {"filled": 4.0, "original": 10.0, "is_filled": True,
+                                         "fully_filled": False, "price": 0, "status": "LIVE"}
+    assert feed.order_status("full")["status"] == "MATCHED"
+    assert feed.order_status("full")["fully_filled"] is True
+    assert feed.order_status("gone")["status"] == "CANCELED"
+    assert feed.order_status("missing") is None
+
+
+def test_order_status_unknown_size_is_not_a_fill():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "0", None, "PLACEMENT"))
+    assert feed.order_status("a") is None  # Caller falls back to REST
+
+
+def test_wait_for_fills_returns_at_once_when_done():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "10"))
+    feed._handle_event(order_event("b", "1", kind="CANCELLATION"))
+    start = time.time()
+    assert feed.wait_for_fills(["a", "b"], 2.0) is True
+    assert time.time() - start < 0.1
+
+
+def test_wait_for_fills_not_done_with_unknown_size():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "0", None))
+    assert feed.wait_for_fills(["a"], 0.05) is False
+
+
+def test_wait_for_fills_ignores_other_orders():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("mine", "0"))
+    timer = later(0.05, feed._handle_event, order_event("other", "5"))
+    assert feed.wait_for_fills(["mine"], 0.3) is False
+    timer.join()
+
+
+def test_wait_for_fills_wakes_on_own_order_event():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("mine", "0"))
+    later(0.05, feed._handle_event, order_event("mine", "3"))
+    start = time.time()
+    assert feed.wait_for_fills(["mine"], 2.0) is True
+    assert time.time() - start < 1.0
+
+
+def test_wait_for_fills_wakes_on_trade_naming_our_order():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("mine", "0"))
+    trade = {"event_type": "trade", "taker_order_id": "someone",
+             "maker_orders": [{"order_id": "mine"}]}
+    later(0.05, feed._handle_event, trade)
+    assert feed.wait_for_fills(["mine"], 2.0) is True
+
+
+def test_wait_for_order_until_done():
+    feed = ClobUserFeed()
+    feed._handle_event(order_event("a", "2"))
+    assert feed.wait_for_order("a", 0.05) is True
+    assert feed.wait_for_order("a", 0.05, until_done=True) is False
+    later(0.05, feed._handle_event, order_event("a", "10"))
+    assert feed.wait_for_order("a", 2.0, until_done=True) is True
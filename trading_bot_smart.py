@@ -21,10 +21,10 @@ SMART STRATEGY ADDITIONS:
 # BOT VERSION
 # ===========================================
 BOT_VERSION = {
-    "version": "v1.62",
-    "codename": "Trend Guard",
-    "date": "2026-03-01",
-    "changes": "BTC trend filter: skip 99c entries that fight a strong multi-window BTC downtrend/uptrend ($250 threshold over 2 windows)"
+    "version": "v1.63",
+    "codename": "Swift Current",
+    "date": "2026-10-17",
+    "changes": "Latency pass: live WebSocket books + user-feed fill waits on exit/arb paths, pooled HTTP, order I/O and logging off the trading thread"
 }
 
 import os
@@ -33,15 +33,54 @@ import signal
 import time
 import json
 import math
+import re
+import heapq
+import itertools
+import queue
+import atexit
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from collections import deque
+from collections import deque, namedtuple
+from operator import itemgetter, sub
+from bisect import bisect_left, bisect_right
 
 # Timezone for logging (Pacific Time)
 PST = ZoneInfo("America/Los_Angeles")
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor
+from book_walk import parse_levels, bid_vwap, build_chunk_plan, plan_bid_walk
+
+# Polymarket CLOB SDK - imported once here so order paths don't re-import per call
+try:
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import (OrderArgs, MarketOrderArgs, OrderType,
+                                           BalanceAllowanceParams, AssetType)
+    from py_clob_client.order_builder.constants import BUY, SELL
+    CLOB_CLIENT_AVAILABLE = True
+except ImportError:
+    CLOB_CLIENT_AVAILABLE = False
+    ClobClient = OrderArgs = MarketOrderArgs = OrderType = None
+    BalanceAllowanceParams = AssetType = None
+    BUY, SELL = "BUY", "SELL"
+
+# Fast JSON encode/decode for hot paths (optional - falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_line(obj):
+        """Serialize obj as one newline-terminated JSON line (bytes)."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_line(obj):
+        """Serialize obj as one newline-terminated JSON line (bytes)."""
+        return (json.dumps(obj) + "\n").encode()
 
 # Supabase logging (single source of truth - replaces Google Sheets)
 try:
@@ -90,19 +129,49 @@ def log_event(event_type: str, window_id: str = "", **kwargs):
 # Setup file logging (tee to console and file)
 import sys
 class TeeLogger:
+    """Tee output to console and file from a background writer thread.
+
+    write() only enqueues, so print() on the trading path never blocks on a
+    slow terminal/journald pipe or disk. Ordering is preserved by the queue.
+    """
     def __init__(self, filename):
         self.terminal = sys.stdout
         self.log = open(filename, "a", buffering=1)  # Line buffered
+        self._queue = queue.SimpleQueue()
+        threading.Thread(target=self._writer, daemon=True).start()
+        atexit.register(self.flush)
     def write(self, message):
-        self.terminal.write(message)
-        self.log.write(message)
-    def flush(self):
-        self.terminal.flush()
-        self.log.flush()
+        self._queue.put(message)
+    def _writer(self):
+        failed = set()  # Targets whose error was already reported
+        while True:
+            item = self._queue.get()
+            is_flush = isinstance(item, threading.Event)  # flush marker
+            # Separate attempts, so a dead terminal pipe doesn't also drop the bot.log line
+            for name, target in (("terminal", self.terminal), ("log file", self.log)):
+                try:
+                    if is_flush:
+                        target.flush()
+                    else:
+                        target.write(item)
+                except Exception as e:
+                    if name not in failed:
+                        failed.add(name)
+                        try:
+                            sys.__stderr__.write(f"TeeLogger: {name} write failed, further errors suppressed: {e}\n")
+                        except Exception:
+                            pass
+            if is_flush:
+                item.set()
+    def flush(self, timeout=2.0):
+        """Block until everything written so far has reached console and file."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
 
 LOG_FILE = os.path.expanduser("~/polybot/bot.log")
-sys.stdout = TeeLogger(LOG_FILE)
-sys.stderr = TeeLogger(LOG_FILE)
+# One tee (one queue, one writer) for both streams, so stdout/stderr lines keep their order
+sys.stdout = sys.stderr = TeeLogger(LOG_FILE)
 print(f"\n{'='*60}")
 print(f"POLYBOT {BOT_VERSION['codename']} ({BOT_VERSION['version']}) starting...")
 print(f"Changes: {BOT_VERSION['changes']}")
@@ -140,6 +209,39 @@ except ImportError:
     rtds_feed = None
     print("WARNING: rtds_price_feed.py not found - using Chainlink fallback")
 
+# Coinbase BTC-USD ticker (WebSocket) - strategy signals read it instead of a REST fetch per tick
+try:
+    from coinbase_price_feed import CoinbasePriceFeed
+    coinbase_feed = CoinbasePriceFeed()
+    COINBASE_FEED_AVAILABLE = coinbase_feed.start()
+    if COINBASE_FEED_AVAILABLE:
+        print("Coinbase ticker feed starting (BTC-USD WebSocket)")
+except ImportError:
+    COINBASE_FEED_AVAILABLE = False
+    coinbase_feed = None
+    print("WARNING: coinbase_price_feed.py not found - using Coinbase REST prices")
+
+# Live CLOB order book (WebSocket) - lets exit paths skip REST book snapshots
+try:
+    from clob_book_feed import ClobBookFeed
+    book_feed = ClobBookFeed()
+    BOOK_FEED_AVAILABLE = book_feed.start()
+    if BOOK_FEED_AVAILABLE:
+        print("Book feed starting (CLOB market WebSocket)")
+except ImportError:
+    BOOK_FEED_AVAILABLE = False
+    book_feed = None
+    print("WARNING: clob_book_feed.py not found - using REST order books only")
+
+# Live order fills (CLOB user WebSocket) - started in main() once API creds exist
+USER_FEED_AVAILABLE = False
+try:
+    from clob_user_feed import ClobUserFeed
+    user_feed = ClobUserFeed()
+except ImportError:
+    user_feed = None
+    print("WARNING: clob_user_feed.py not found - polling order status only")
+
 # Order book imbalance analyzer
 try:
     from orderbook_analyzer import OrderBookAnalyzer
@@ -288,6 +390,8 @@ HEDGE_ESCALATION = [
     (480, 4),    # 8-10 min: Accept 3c loss (tolerance = 4c, so 103c combined)
     (600, 6),    # 10+ min: Accept 5c loss (tolerance = 6c, so 105c combined)
 ]
+_HEDGE_THRESHOLDS = [t for t, _ in HEDGE_ESCALATION]  # Sorted - bisected in calculate_hedge_price()
+_HEDGE_TOLS = [c for _, c in HEDGE_ESCALATION]
 HEDGE_PRICE_CAP = 0.50             # Never hedge above 50c
 
 # ===========================================
@@ -362,6 +466,8 @@ CAPTURE_99C_TIME_PENALTIES = [
     (300,  0.08),   # 2-5 min: -8%
     (9999, 0.15),   # 5+ min: -15% (very uncertain)
 ]
+_PENALTY_MAX_TIMES = [t for t, _ in CAPTURE_99C_TIME_PENALTIES]  # Sorted - bisected in calculate_99c_confidence()
+_PENALTY_VALUES = [p for _, p in CAPTURE_99C_TIME_PENALTIES]
 
 # Velocity tracking for danger score
 VELOCITY_WINDOW_SECONDS = 5  # Rolling window for BTC price velocity
@@ -438,6 +544,20 @@ error_count = 0
 # HTTP session
 http_session = requests.Session()
 http_session.headers.update({"User-Agent": "Mozilla/5.0"})
+# Larger keep-alive pool + fast retry on gateway errors. GET only (POSTs like Telegram
+# aren't safe to replay) and no read retries, so a slow endpoint can't multiply its timeout.
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, connect=2, read=0, status=2, backoff_factor=0.1,
+                      status_forcelist=[502, 503, 504], allowed_methods=["GET"])
+)
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+
+def _resp_json(resp):
+    """Decode a response body with the fastest available JSON parser."""
+    return _json_loads(resp.content)
 
 # CLOB client
 clob_client = None
@@ -499,6 +619,39 @@ last_pair_type = None
 BOT_ID = "CHATGPT-SMART"
 ACTIVITY_LOG_FILE = os.path.expanduser("~/activity_log.jsonl")
 
+# Activity entries are serialized by the caller (details may hold live, mutable state)
+# and written by a background thread, so order paths (FOK sells, hard stop) never wait on disk
+_activity_queue = queue.SimpleQueue()
+
+def _activity_writer():
+    """Drain queued activity entries to ACTIVITY_LOG_FILE in batches."""
+    while True:
+        batch = [_activity_queue.get()]
+        while True:
+            try:
+                batch.append(_activity_queue.get_nowait())
+            except queue.Empty:
+                break
+        markers = [item for item in batch if isinstance(item, threading.Event)]
+        lines = [item for item in batch if not isinstance(item, threading.Event)]
+        try:
+            if lines:
+                with open(ACTIVITY_LOG_FILE, "ab") as f:
+                    f.writelines(lines)
+        except Exception as e:
+            print(f"[{ts()}] LOG_ERROR: Failed to write activity log: {e}")
+        for marker in markers:
+            marker.set()
+
+def _flush_activity_log(timeout=2.0):
+    """Block until queued activity entries are on disk (used at exit)."""
+    done = threading.Event()
+    _activity_queue.put(done)
+    done.wait(timeout)
+
+threading.Thread(target=_activity_writer, daemon=True).start()
+atexit.register(_flush_activity_log)
+
 def log_activity(action, details=None):
     """Log activity to shared JSONL file + buffer for Supabase"""
     try:
@@ -508,8 +661,7 @@ def log_activity(action, details=None):
             "action": action,
             "details": details or {}
         }
-        with open(ACTIVITY_LOG_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        _activity_queue.put(_json_line(entry))
         # Also buffer for Supabase (non-blocking)
         window_id = window_state.get('window_id', '') if window_state else ''
         supabase_buffer_activity(action, window_id, details)
@@ -604,7 +756,8 @@ def get_arb_imbalance():
 
 def init_clob_client(max_retries=3):
     global clob_client
-    from py_clob_client.client import ClobClient
+    if not CLOB_CLIENT_AVAILABLE:
+        raise ImportError("py_clob_client is not installed")
 
     for attempt in range(max_retries):
         try:
@@ -631,25 +784,35 @@ def init_clob_client(max_retries=3):
 
 TELEGRAM_CONFIG_FILE = os.path.expanduser('~/.telegram-bot.json')
 telegram_config = None
+telegram_send_url = None  # sendMessage endpoint, built once in init_telegram()
 
 def init_telegram():
-    global telegram_config
+    global telegram_config, telegram_send_url
     try:
         if os.path.exists(TELEGRAM_CONFIG_FILE):
             with open(TELEGRAM_CONFIG_FILE, 'r') as f:
                 telegram_config = json.load(f)
+            telegram_send_url = f"https://api.telegram.org/bot{telegram_config['token']}/sendMessage"
             print(f"[Telegram] Bot connected")
             return True
     except Exception as e:
         print(f"[Telegram] Error: {e}")
     return False
 
+# Single sender thread: alerts go out in the order they were raised, and no
+# caller (exit paths included) waits on Telegram's round trip
+_TG_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tg')
+
 def send_telegram(message):
+    """Queue a Telegram alert; the HTTPS post happens on the sender thread."""
     if not telegram_config:
         return
+    _TG_POOL.submit(_post_telegram, message)
+
+def _post_telegram(message):
     try:
-        url = f"https://api.telegram.org/bot{telegram_config['token']}/sendMessage"
-        requests.post(url, data={
+        # Pooled session keeps the TLS connection to Telegram alive between alerts
+        http_session.post(telegram_send_url, data={
             "chat_id": telegram_config['chat_id'],
             "text": message,
             "parse_mode": "HTML"
@@ -677,7 +840,7 @@ def check_eoa_gas_balance():
             "id": 1
         }
         response = requests.post(POLYGON_RPC, json=payload, timeout=5)
-        result = response.json().get("result")
+        result = _resp_json(response).get("result")
         if result:
             balance_wei = int(result, 16)
             balance_matic = balance_wei / 1e18
@@ -688,6 +851,17 @@ def check_eoa_gas_balance():
 
 USDC_CONTRACT = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # USDC on Polygon
 
+# balanceOf(WALLET_ADDRESS) calldata/payload - wallet is fixed, so build once at import
+_USDC_BALANCEOF_CALLDATA = (
+    "0x70a08231" + WALLET_ADDRESS.lower().replace('0x', '').zfill(64)
+) if WALLET_ADDRESS else None
+_USDC_BALANCE_PAYLOAD = {
+    "jsonrpc": "2.0",
+    "method": "eth_call",
+    "params": [{"to": USDC_CONTRACT, "data": _USDC_BALANCEOF_CALLDATA}, "latest"],
+    "id": 1
+}
+
 def get_portfolio_balance():
     """Get total portfolio balance: positions value + USDC cash."""
     positions_value = 0.0
@@ -697,23 +871,15 @@ def get_portfolio_balance():
     try:
         url = f"https://data-api.polymarket.com/positions?user={WALLET_ADDRESS.lower()}"
         resp = http_session.get(url, timeout=5)
-        for pos in resp.json():
+        for pos in _resp_json(resp):
             positions_value += float(pos.get('currentValue', 0))
     except Exception as e:
         print(f"[BALANCE] Position query failed: {e}")
 
     # 2. Check USDC balance via ERC20 balanceOf
     try:
-        addr_padded = WALLET_ADDRESS.lower().replace('0x', '').zfill(64)
-        data = f"0x70a08231{addr_padded}"
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_call",
-            "params": [{"to": USDC_CONTRACT, "data": data}, "latest"],
-            "id": 1
-        }
-        response = requests.post(POLYGON_RPC, json=payload, timeout=5)
-        result = response.json().get("result")
+        response = http_session.post(POLYGON_RPC, json=_USDC_BALANCE_PAYLOAD, timeout=5)
+        result = _resp_json(response).get("result")
         if result:
             usdc_balance = int(result, 16) / 1e6  # USDC has 6 decimals
     except Exception as e:
@@ -784,14 +950,15 @@ Send MATIC to:
 
     return balance
 
-def notify_profit_pair(up_shares, avg_up, down_shares, avg_down):
-    """PROFIT_PAIR notification"""
+def notify_profit_pair(up_shares, avg_up, down_shares, avg_down, pair_total=None):
+    """PROFIT_PAIR notification (pair_total may be passed in if already computed)"""
     global window_state
     if window_state.get('telegram_notified'):
         return
     window_state['telegram_notified'] = True
 
-    pair_total = avg_up + avg_down
+    if pair_total is None:
+        pair_total = avg_up + avg_down
     edge = 1.00 - pair_total
     conf = window_state.get('smart_signal_confidence', 0)
 
@@ -805,14 +972,15 @@ Signal confidence: {conf}%
 Status: SAFE"""
     send_telegram(msg)
 
-def notify_loss_avoid_pair(up_shares, avg_up, down_shares, avg_down):
-    """LOSS_AVOID_PAIR notification"""
+def notify_loss_avoid_pair(up_shares, avg_up, down_shares, avg_down, pair_total=None):
+    """LOSS_AVOID_PAIR notification (pair_total may be passed in if already computed)"""
     global window_state
     if window_state.get('telegram_notified'):
         return
     window_state['telegram_notified'] = True
 
-    pair_total = avg_up + avg_down
+    if pair_total is None:
+        pair_total = avg_up + avg_down
     edge = 1.00 - pair_total
 
     msg = f"""🟧 <b>LOSS-AVOID PAIR</b>
@@ -889,16 +1057,22 @@ Total P&L: ${sniper_stats['total_pnl']:+.2f}
 ROI: {pnl_pct:+.1f}% (of $5 avg)"""
     send_telegram(msg)
 
+_resolved_slugs = {}  # slug -> winning side ("UP"/"DOWN"); settled markets never change
+
 def check_99c_outcome(side, slug):
     """Check if our 99c bet won by querying Polymarket API for actual settlement"""
     if not slug:
         return None
 
+    winning_side = _resolved_slugs.get(slug)
+    if winning_side:
+        return side.upper() == winning_side
+
     try:
         # Query gamma API for actual market outcome
         url = f"https://gamma-api.polymarket.com/events?slug={slug}"
         resp = requests.get(url, timeout=10)
-        data = resp.json()
+        data = _resp_json(resp)
 
         if not data:
             return None
@@ -918,26 +1092,26 @@ def check_99c_outcome(side, slug):
             prices_str = market.get('outcomePrices', '[]')
 
             if isinstance(outcomes_str, str):
-                outcomes_list = json.loads(outcomes_str)
+                outcomes_list = _json_loads(outcomes_str)
             else:
                 outcomes_list = outcomes_str
 
             if isinstance(prices_str, str):
-                prices_list = json.loads(prices_str)
+                prices_list = _json_loads(prices_str)
             else:
                 prices_list = prices_str
 
             # Find which outcome has price = 1.0 (the winner)
             if outcomes_list and prices_list and len(outcomes_list) == len(prices_list):
-                for outcome, price in zip(outcomes_list, prices_list):
-                    if float(price) > 0.9:  # Winner has price ~1.0
-                        winning_side = outcome.upper()
-                        break
+                # Winner has price ~1.0
+                winning_side = next((o.upper() for o, p in zip(outcomes_list, prices_list)
+                                     if float(p) > 0.9), None)
 
             if winning_side:
                 break
 
         if winning_side:
+            _resolved_slugs[slug] = winning_side
             # Compare our side with winning side
             return side.upper() == winning_side
 
@@ -947,6 +1121,17 @@ def check_99c_outcome(side, slug):
         print(f"[{ts()}] check_99c_outcome error: {e}")
         return None
 
+# Fixed rows of the pair-outcome console boxes
+_PROFIT_BOX_TOP = "╔" + "═" * 60 + "╗"
+_PROFIT_BOX_TITLE = "║  💰💰💰 PROFIT LOCKED! 💰💰💰                               ║"
+_PROFIT_BOX_SEP = "╠" + "═" * 60 + "╣"
+_PROFIT_BOX_RULE = "║  ────────────────────────────────────────                  ║"
+_PROFIT_BOX_BOTTOM = "╚" + "═" * 60 + "╝"
+_LOSS_BOX_TOP = "┌" + "─" * 60 + "┐"
+_LOSS_BOX_TITLE = "│  🟧 LOSS AVOIDED                                           │"
+_LOSS_BOX_SEP = "├" + "─" * 60 + "┤"
+_LOSS_BOX_BOTTOM = "└" + "─" * 60 + "┘"
+
 def _send_pair_outcome_notification():
     """Send appropriate notification when pair completes"""
     global last_pair_type, session_counters
@@ -979,17 +1164,17 @@ def _send_pair_outcome_notification():
         up_cost = avg_up * min_shares
         dn_cost = avg_down * min_shares
         print()
-        print("╔════════════════════════════════════════════════════════════╗")
-        print("║  💰💰💰 PROFIT LOCKED! 💰💰💰                               ║")
-        print("╠════════════════════════════════════════════════════════════╣")
+        print(_PROFIT_BOX_TOP)
+        print(_PROFIT_BOX_TITLE)
+        print(_PROFIT_BOX_SEP)
         print(f"║  UP: {min_shares:.0f} shares @ {avg_up*100:.0f}c  =  ${up_cost:.2f}".ljust(60) + "║")
         print(f"║  DN: {min_shares:.0f} shares @ {avg_down*100:.0f}c  =  ${dn_cost:.2f}".ljust(60) + "║")
-        print("║  ────────────────────────────────────────                  ║")
+        print(_PROFIT_BOX_RULE)
         print(f"║  Total Cost: ${total_cost:.2f}  →  Payout: ${payout:.2f}".ljust(60) + "║")
         print(f"║  🎉 GUARANTEED PROFIT: ${profit:.2f} ({profit_per_pair*100:.0f}c per pair)".ljust(60) + "║")
-        print("╚════════════════════════════════════════════════════════════╝")
+        print(_PROFIT_BOX_BOTTOM)
         print()
-        notify_profit_pair(up_shares, avg_up, down_shares, avg_down)
+        notify_profit_pair(up_shares, avg_up, down_shares, avg_down, pair_total)
         log_event("PROFIT_PAIR", window_state.get('window_id', ''),
                         up_shares=min_shares, up_price=avg_up,
                         down_shares=min_shares, down_price=avg_down,
@@ -999,14 +1184,14 @@ def _send_pair_outcome_notification():
         session_counters['loss_avoid_pairs'] += 1
         loss = total_cost - payout
         print()
-        print("┌────────────────────────────────────────────────────────────┐")
-        print("│  🟧 LOSS AVOIDED                                           │")
-        print("├────────────────────────────────────────────────────────────┤")
+        print(_LOSS_BOX_TOP)
+        print(_LOSS_BOX_TITLE)
+        print(_LOSS_BOX_SEP)
         print(f"│  UP: {min_shares:.0f} @ {avg_up*100:.0f}c + DN: {min_shares:.0f} @ {avg_down*100:.0f}c = {pair_total*100:.0f}c".ljust(60) + "│")
         print(f"│  Cost: ${total_cost:.2f} → Payout: ${payout:.2f} | Loss capped: ${loss:.2f}".ljust(60) + "│")
-        print("└────────────────────────────────────────────────────────────┘")
+        print(_LOSS_BOX_BOTTOM)
         print()
-        notify_loss_avoid_pair(up_shares, avg_up, down_shares, avg_down)
+        notify_loss_avoid_pair(up_shares, avg_up, down_shares, avg_down, pair_total)
         log_event("LOSS_AVOID", window_state.get('window_id', ''),
                         up_shares=min_shares, up_price=avg_up,
                         down_shares=min_shares, down_price=avg_down,
@@ -1016,10 +1201,15 @@ def _send_pair_outcome_notification():
 # DATA FETCHING
 # ============================================================================
 
+_cached_slug = (None, 0)  # (slug, window_start) - slug only changes every 15 minutes
+
 def get_current_slug():
+    global _cached_slug
     current = int(time.time())
-    window_start = (current // 900) * 900
-    return f"btc-updown-15m-{window_start}", window_start
+    window_start = current - current % 900
+    if _cached_slug[1] != window_start:
+        _cached_slug = (f"btc-updown-15m-{window_start}", window_start)
+    return _cached_slug
 
 def get_market_data(slug):
     try:
@@ -1028,17 +1218,23 @@ def get_market_data(slug):
         resp = http_session.get(url, timeout=3)
         latency_ms = (time.time() - start) * 1000
         api_latencies.append(latency_ms)
-        data = resp.json()
+        data = _resp_json(resp)
         return data[0] if data else None
     except Exception as e:
         print(f"[{ts()}] MARKET_DATA_ERROR: {e}")
         return None
 
+_end_ts_cache = {}  # endDate ISO string -> epoch seconds (parsed once per market)
+
 def get_time_remaining(market):
     try:
         end_str = market.get('markets', [{}])[0].get('endDate', '')
-        end_time = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
-        remaining = (end_time - datetime.now(timezone.utc)).total_seconds()
+        end_ts = _end_ts_cache.get(end_str)
+        if end_ts is None:
+            end_ts = datetime.fromisoformat(end_str.replace('Z', '+00:00')).timestamp()
+            _end_ts_cache.clear()  # only the current window's market is ever needed
+            _end_ts_cache[end_str] = end_ts
+        remaining = end_ts - time.time()
         if remaining < 0:
             return "ENDED", -1
         return f"{int(remaining)//60:02d}:{int(remaining)%60:02d}", remaining
@@ -1046,6 +1242,38 @@ def get_time_remaining(market):
         print(f"[{ts()}] TIME_PARSE_ERROR: {e}")
         return "??:??", 0
 
+def _best_first(levels, asks):
+    """Return book levels ordered best-first (asks ascending, bids descending).
+
+    Price and size are parsed to floats here, once, to match the live feed's books.
+    The CLOB returns levels worst-first, so one pass to confirm the order plus a
+    reversal replaces a full sort. Falls back to sorting if the payload isn't monotonic.
+    """
+    rows = [{'price': float(x['price']), 'size': float(x.get('size') or 0)} for x in levels]
+    prices = [r['price'] for r in rows]
+    if asks:
+        worst_first = all(a >= b for a, b in zip(prices, prices[1:]))
+    else:
+        worst_first = all(a <= b for a, b in zip(prices, prices[1:]))
+    if worst_first:
+        return rows[::-1]
+    return sorted(rows, key=itemgetter('price'), reverse=not asks)
+
+# Top of book for both sides as floats (0.0 = side empty)
+BookTop = namedtuple('BookTop', 'up_bid up_ask down_bid down_ask up_bid_size down_bid_size')
+
+def book_top(books):
+    """Best bid/ask for both sides, parsed once per books dict and cached on it."""
+    top = books.get('_top')
+    if top is None:
+        def lvl(key, field='price'):
+            levels = books.get(key)
+            return float(levels[0][field]) if levels else 0.0
+        top = BookTop(lvl('up_bids'), lvl('up_asks'), lvl('down_bids'), lvl('down_asks'),
+                      lvl('up_bids', 'size'), lvl('down_bids', 'size'))
+        books['_top'] = top
+    return top
+
 def get_order_books(market):
     """Fetch full order books for UP and DOWN tokens"""
     try:
@@ -1055,6 +1283,9 @@ def get_order_books(market):
         if len(tokens) < 2:
             return None
 
+        if BOOK_FEED_AVAILABLE:
+            book_feed.track(tokens[0], tokens[1])
+
         def fetch_book(token_id):
             try:
                 start = time.time()
@@ -1062,31 +1293,54 @@ def get_order_books(market):
                 resp = http_session.get(url, timeout=3)
                 latency_ms = (time.time() - start) * 1000
                 api_latencies.append(latency_ms)
-                book = resp.json()
+                book = _resp_json(resp)
                 return book.get('asks', []), book.get('bids', [])
             except Exception as e:
                 print(f"[{ts()}] BOOK_FETCH_ERROR: {e}")
                 return [], []
 
-        with ThreadPoolExecutor(max_workers=2) as ex:
-            up_future = ex.submit(fetch_book, tokens[0])
-            down_future = ex.submit(fetch_book, tokens[1])
+        # UP on the shared pool, DOWN on this thread - no executor spun up per call
+        up_future = _ORDER_POOL.submit(fetch_book, tokens[0])
+        down_asks, down_bids = fetch_book(tokens[1])
+        up_asks, up_bids = up_future.result(timeout=3)
 
-            up_asks, up_bids = up_future.result(timeout=3)
-            down_asks, down_bids = down_future.result(timeout=3)
-
-            return {
-                'up_asks': sorted(up_asks, key=lambda x: float(x['price'])),
-                'up_bids': sorted(up_bids, key=lambda x: float(x['price']), reverse=True),
-                'down_asks': sorted(down_asks, key=lambda x: float(x['price'])),
-                'down_bids': sorted(down_bids, key=lambda x: float(x['price']), reverse=True),
-                'up_token': tokens[0],
-                'down_token': tokens[1]
-            }
+        return {
+            'up_asks': _best_first(up_asks, asks=True),
+            'up_bids': _best_first(up_bids, asks=False),
+            'down_asks': _best_first(down_asks, asks=True),
+            'down_bids': _best_first(down_bids, asks=False),
+            'up_token': tokens[0],
+            'down_token': tokens[1]
+        }
     except Exception as e:
         print(f"[{ts()}] ORDER_BOOK_ERROR: {e}")
         return None
 
+def get_live_books(market):
+    """Order books from the WebSocket feed when live, else a REST snapshot."""
+    if BOOK_FEED_AVAILABLE:
+        books = book_feed.snapshot(window_state.get('up_token'), window_state.get('down_token'))
+        if books:
+            return books
+    return get_order_books(market)
+
+def wait_for_book_change(timeout, token=None):
+    """Sleep up to `timeout` seconds, waking early when the live book feed updates.
+
+    Pass `token` to wake only on changes to that token's book.
+    """
+    if BOOK_FEED_AVAILABLE and book_feed.is_connected():
+        book_feed.wait_for_update(timeout, token)
+    else:
+        time.sleep(timeout)
+
+def wait_for_order_fills(order_ids, timeout):
+    """Sleep up to `timeout` seconds, waking early when the user feed reports activity on `order_ids`."""
+    if USER_FEED_AVAILABLE and user_feed.is_connected():
+        user_feed.wait_for_fills(order_ids, timeout)
+    else:
+        time.sleep(timeout)
+
 def get_btc_price_from_coinbase():
     """Fetch current BTC price from Coinbase for strategy signals"""
     try:
@@ -1095,20 +1349,38 @@ def get_btc_price_from_coinbase():
             timeout=2
         )
         if resp.status_code == 200:
-            data = resp.json()
+            data = _resp_json(resp)
             return float(data['data']['amount'])
     except Exception as e:
         print(f"[{ts()}] COINBASE_PRICE_ERROR: {e}")
     return None
 
+def get_live_btc_price():
+    """BTC price for strategy signals: the Coinbase ticker stream when live, else Coinbase REST.
+
+    Both are Coinbase BTC-USD, so falling back doesn't feed a second source's
+    price into the momentum history.
+    """
+    if COINBASE_FEED_AVAILABLE:
+        btc_price = coinbase_feed.get_price()
+        if btc_price:
+            return btc_price
+    return get_btc_price_from_coinbase()
+
 # ============================================================================
 # SHARE SIZE CALCULATION
 # ============================================================================
 
+# minShares for every price on the 1c tick grid, indexed by cents (index 0 unused)
+_MIN_SHARES_LUT = [MIN_SHARES] + [math.ceil(max(MIN_SHARES, 1.0 / (c / 100))) for c in range(1, 101)]
+
 def min_shares(price):
     """minShares(p) = ceil(max(5, 1/p))"""
     if price <= 0:
         return MIN_SHARES
+    cents = round(price * 100)
+    if 0 < cents <= 100 and abs(cents - price * 100) < 1e-6:
+        return _MIN_SHARES_LUT[cents]
     return math.ceil(max(MIN_SHARES, 1.0 / price))
 
 def calc_q(bid_up, bid_down):
@@ -1123,8 +1395,14 @@ def floor_to_tick(price):
 # LOGGING
 # ============================================================================
 
+_ts_cache = (0, "")  # (epoch second, formatted) - ts() only reformats when the second changes
+
 def ts():
-    return datetime.now(PST).strftime("%H:%M:%S")
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache = (now, datetime.fromtimestamp(now, PST).strftime("%H:%M:%S"))
+    return _ts_cache[1]
 
 def get_mode_display(ttc):
     imb = get_arb_imbalance()  # Use ARB imbalance (excludes 99c captures)
@@ -1214,26 +1492,23 @@ def log_state(ttc, books=None):
                 btc_str = f"BTC:${btc_price:,.0f}({delta_sign}${btc_delta:,.0f}) | "
             else:
                 btc_str = f"BTC:${btc_price:,.0f}({btc_age}s) | "
-            btc_price_history.append((time.time(), btc_price))
+            btc_price_history.append((now, btc_price))
     elif CHAINLINK_AVAILABLE and chainlink_feed:
         # Fallback to Chainlink if RTDS unavailable
         btc_price, btc_age = chainlink_feed.get_price_with_age()
         if btc_price:
             btc_str = f"BTC:${btc_price:,.0f}({btc_age}s) | "
-            btc_price_history.append((time.time(), btc_price))
+            btc_price_history.append((now, btc_price))
 
     # v1.24: Track market prices for entry filter
-    market_price_history.append((time.time(), ask_up, ask_down))
+    market_price_history.append((now, ask_up, ask_down))
 
     # Get order book imbalance
     ob_str = ""
     up_imb = None
     down_imb = None
     if ORDERBOOK_ANALYZER_AVAILABLE and orderbook_analyzer and books and ORDERBOOK_LOG_ALWAYS:
-        ob_result = orderbook_analyzer.analyze(
-            books.get('up_bids', []), books.get('up_asks', []),
-            books.get('down_bids', []), books.get('down_asks', [])
-        )
+        ob_result = orderbook_analyzer.analyze_books(books)
         up_imb = ob_result['up_imbalance']
         down_imb = ob_result['down_imbalance']
         signal = ob_result['signal']
@@ -1284,8 +1559,25 @@ def log_order_event(order_id, side, action, price, qty, filled, avg_fill, reason
 # ORDER MANAGEMENT
 # ============================================================================
 
-def place_limit_order(token_id, price, size, side="BUY", bypass_price_failsafe=False):
-    """Place a post-only limit order with FAILSAFE checks"""
+# Shared pool for concurrent order placement, status polls and cancels (created once, reused)
+_ORDER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='order')
+
+def sign_limit_order(token_id, price, size, side="BUY"):
+    """Build and sign a limit order without posting it (None if signing fails)."""
+    try:
+        return clob_client.create_order(
+            OrderArgs(token_id=token_id, price=price, size=size,
+                      side=BUY if side == "BUY" else SELL)
+        )
+    except Exception as e:
+        print(f"[{ts()}] ORDER_SIGN_ERROR: {e}")
+        return None
+
+def place_limit_order(token_id, price, size, side="BUY", bypass_price_failsafe=False, signed_order=None):
+    """Place a post-only limit order with FAILSAFE checks
+
+    Pass `signed_order` from sign_limit_order() (same args) to skip signing here.
+    """
 
     # v1.46: Defense-in-depth - block ALL orders when trading is halted
     if trading_halted:
@@ -1310,19 +1602,19 @@ def place_limit_order(token_id, price, size, side="BUY", bypass_price_failsafe=F
         return False, "FAILSAFE: order cost too high"
 
     try:
-        from py_clob_client.clob_types import OrderArgs
-        from py_clob_client.order_builder.constants import BUY, SELL
-
-        order_side = BUY if side == "BUY" else SELL
-
-        result = clob_client.create_and_post_order(
-            OrderArgs(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=order_side,
+        if signed_order is not None:
+            result = clob_client.post_order(signed_order)
+        else:
+            order_side = BUY if side == "BUY" else SELL
+
+            result = clob_client.create_and_post_order(
+                OrderArgs(
+                    token_id=token_id,
+                    price=price,
+                    size=size,
+                    side=order_side,
+                )
             )
-        )
         order_id = result.get('orderID', str(result))
         log_activity("ORDER_PLACED", {"order_id": order_id, "side": side, "price": price, "size": size})
         return True, order_id
@@ -1334,6 +1626,18 @@ def place_limit_order(token_id, price, size, side="BUY", bypass_price_failsafe=F
 # HARD STOP - FOK MARKET ORDERS (v1.34)
 # ============================================================================
 
+# CLOB errors meaning the shares are already gone (sold/unapproved), not a transient reject
+_BAL_ERR_RE = re.compile(r'not enough balance|allowance', re.IGNORECASE)
+
+# Parsed FOK post_order response
+FokResp = namedtuple('FokResp', 'order_id status filled')
+
+def _parse_fok(response) -> FokResp:
+    """Pull the fields we use out of a post_order response in one pass."""
+    return FokResp(response.get("orderID", "unknown"),
+                   response.get("status", "UNKNOWN"),
+                   float(response.get("filledAmount") or 0.0))
+
 def place_fok_market_sell(token_id: str, shares: float) -> tuple:
     """
     Place a Fill-or-Kill market sell order for guaranteed execution.
@@ -1345,17 +1649,17 @@ def place_fok_market_sell(token_id: str, shares: float) -> tuple:
     Returns:
         tuple: (success, order_id, filled_shares, is_balance_error)
     """
-    global clob_client
-
     # v1.46: Defense-in-depth - block ALL orders when trading is halted
     if trading_halted:
         print(f"[{ts()}] [HALT] BLOCKED: FOK SELL x{shares} - trading halted (ROI target reached)")
         return False, None, 0, False
 
-    try:
-        from py_clob_client.clob_types import MarketOrderArgs, OrderType
-        from py_clob_client.order_builder.constants import SELL
+    return _place_fok_market_sell_unchecked(token_id, shares)
 
+
+def _place_fok_market_sell_unchecked(token_id: str, shares: float) -> tuple:
+    """place_fok_market_sell() without the halt check - caller must have done it."""
+    try:
         print(f"[{ts()}] HARD_STOP: Placing FOK market sell: {shares:.1f} shares")
 
         # Create market sell order
@@ -1370,11 +1674,10 @@ def place_fok_market_sell(token_id: str, shares: float) -> tuple:
         response = clob_client.post_order(signed_order, orderType=OrderType.FOK)
 
         # Parse response
-        order_id = response.get("orderID", "unknown")
-        status = response.get("status", "UNKNOWN")
-        filled = float(response.get("filledAmount", 0))
+        order_id, status, filled = _parse_fok(response)
 
         if status == "MATCHED" or filled > 0:
+            invalidate_position_cache()
             print(f"[{ts()}] HARD_STOP: FOK filled {filled}/{shares} shares, order_id={order_id[:8]}...")
             log_activity("FOK_FILLED", {"order_id": order_id, "filled": filled, "requested": shares})
             return True, order_id, filled, False
@@ -1384,13 +1687,47 @@ def place_fok_market_sell(token_id: str, shares: float) -> tuple:
             return False, order_id, 0.0, False
 
     except Exception as e:
-        error_str = str(e).lower()
-        is_balance_error = 'not enough balance' in error_str or 'allowance' in error_str
+        error_str = str(e)
+        is_balance_error = bool(_BAL_ERR_RE.search(error_str))
         print(f"[{ts()}] HARD_STOP_ERROR: FOK order failed: {e}" + (" [BALANCE ERROR]" if is_balance_error else ""))
-        log_activity("FOK_ERROR", {"error": str(e), "balance_error": is_balance_error})
+        log_activity("FOK_ERROR", {"error": error_str, "balance_error": is_balance_error})
         return False, "", 0.0, is_balance_error
 
 
+# Per-side dict keys for books / window_state, built once instead of f-strings per call.
+# top_* are BookTop field indexes; opp* describe the other side.
+SIDE_KEYS = {
+    side: {
+        'bids': f'{side.lower()}_bids',
+        'asks': f'{side.lower()}_asks',
+        'token': f'{side.lower()}_token',
+        'filled': f'capture_99c_filled_{side.lower()}',
+        'top_bid': BookTop._fields.index(f'{side.lower()}_bid'),
+        'top_ask': BookTop._fields.index(f'{side.lower()}_ask'),
+        'opp': opp,
+        'opp_token': f'{opp.lower()}_token',
+        'opp_top_ask': BookTop._fields.index(f'{opp.lower()}_ask'),
+    }
+    for side, opp in (("UP", "DOWN"), ("DOWN", "UP"))
+}
+
+
+def probe_top(books: dict, side: str, with_depth: bool = False) -> tuple:
+    """
+    Top-of-book probe for our side's bids.
+
+    Returns:
+        tuple: (best_bid, best_bid_size, total_depth) - zeros if no bids;
+               total_depth is only summed when with_depth=True
+    """
+    bids = books.get(SIDE_KEYS[side]['bids']) if books else None
+    if not bids:
+        return 0.0, 0.0, 0.0
+    b0 = bids[0]
+    depth = sum(float(b.get('size') or 0) for b in bids) if with_depth else 0.0
+    return float(b0['price']), float(b0.get('size') or 0), depth
+
+
 def check_hard_stop_trigger(books: dict, side: str) -> tuple:
     """
     Check if hard stop should trigger based on best bid.
@@ -1406,18 +1743,9 @@ def check_hard_stop_trigger(books: dict, side: str) -> tuple:
         return False, 0.0
 
     try:
-        # Get bids for our side
-        bids_key = f'{side.lower()}_bids'
-        bids = books.get(bids_key, [])
-
-        # No bids = no trigger (can't sell into nothing)
-        if not bids or len(bids) == 0:
-            return False, 0.0
-
-        best_bid = float(bids[0]['price'])
-        best_bid_size = float(bids[0].get('size', 0))
+        best_bid, best_bid_size, _ = probe_top(books, side)
 
-        # Must have actual size, not just phantom price
+        # No bids, or a phantom price with no size = no trigger (can't sell into nothing)
         if best_bid_size <= 0:
             return False, 0.0
 
@@ -1433,6 +1761,50 @@ def check_hard_stop_trigger(books: dict, side: str) -> tuple:
         return False, 0.0
 
 
+def _warm_clob_connection():
+    """Touch the CLOB host so the SDK's pooled connection is open before an urgent order."""
+    try:
+        if clob_client:
+            clob_client.get_ok()
+    except Exception:
+        pass
+
+
+def _has_bid_size(bids):
+    """True if the best bid level has size (raw book levels)."""
+    return bool(bids) and float(bids[0].get('size') or 0) > 0
+
+
+def _wait_for_bids(books, bids_key, token, cached_market, timeout, ready):
+    """
+    Wait up to `timeout` seconds for our side's bids to satisfy `ready`.
+
+    Ask-side updates on our token wake the feed but don't end the wait, so a
+    hard-stop retry keeps its full spacing unless the bids actually move.
+
+    Args:
+        books: Current books (returned unchanged if nothing fresher arrives)
+        bids_key: Our side's bids key, e.g. 'up_bids'
+        token: Our token, to wake only on its book
+        cached_market: Market for get_live_books(), or None
+        timeout: Max seconds to wait
+        ready: Called with the fresh raw bid levels; True ends the wait
+
+    Returns:
+        dict: Latest books
+    """
+    deadline = time.time() + timeout
+    while True:
+        left = deadline - time.time()
+        if left <= 0:
+            return books
+        wait_for_book_change(left, token)
+        if cached_market:
+            books = get_live_books(cached_market) or books
+        if books and ready(books.get(bids_key) or []):
+            return books
+
+
 def execute_hard_stop(side: str, books: dict) -> tuple:
     """
     Execute emergency hard stop using FOK market orders.
@@ -1447,9 +1819,14 @@ def execute_hard_stop(side: str, books: dict) -> tuple:
     """
     global window_state
 
+    # Open the CLOB connection (TCP+TLS) while the position query is in flight,
+    # so the first FOK doesn't pay the handshake
+    threading.Thread(target=_warm_clob_connection, daemon=True).start()
+
     # Query ACTUAL position from API (not tracked amount) to avoid "not enough balance" errors
-    tracked_shares = window_state.get(f'capture_99c_filled_{side.lower()}', 0)
-    api_pos = verify_position_from_api()
+    keys = SIDE_KEYS[side]
+    tracked_shares = window_state.get(keys['filled'], 0)
+    api_pos = get_cached_position()
 
     if api_pos is not None:
         actual_shares = api_pos[0] if side == 'UP' else api_pos[1]
@@ -1464,8 +1841,10 @@ def execute_hard_stop(side: str, books: dict) -> tuple:
         print(f"[{ts()}] HARD_STOP: No shares to sell for {side}")
         return False, 0.0
 
-    token = window_state.get(f'{side.lower()}_token')
+    # Bind the window_state fields the retry loop needs once, up front
+    token = window_state.get(keys['token'])
     entry_price = window_state.get('capture_99c_fill_price', 0.99)
+    cached_market = window_state.get('cached_market')
 
     remaining_shares = shares
     total_pnl = 0.0
@@ -1481,74 +1860,81 @@ def execute_hard_stop(side: str, books: dict) -> tuple:
     print(f"Entry Price: {entry_price*100:.0f}c")
     print("=" * 50)
 
+    # v1.46 halt check done once here - the loop posts through the unchecked FOK helper
+    if trading_halted:
+        print(f"[{ts()}] [HALT] BLOCKED: HARD_STOP FOK SELL x{shares} - trading halted (ROI target reached)")
+        return False, 0.0
+
     while remaining_shares > 0 and attempts < max_attempts:
         attempts += 1
+        now_ts = ts()
 
-        # Get current best bid
-        bids_key = f'{side.lower()}_bids'
-        bids = books.get(bids_key, [])
+        # Parse our side's bids to floats once per book read
+        bids = parse_levels(books.get(keys['bids'], [])) if books else []
 
-        if not bids or len(bids) == 0:
-            print(f"[{ts()}] HARD_STOP: No bids available, waiting 1s (attempt {attempts})")
-            time.sleep(1)
-            # Refresh order books
-            if window_state.get('cached_market'):
-                books = get_order_books(window_state['cached_market'])
+        if not bids:
+            print(f"[{now_ts}] HARD_STOP: No bids available, waiting up to 1s (attempt {attempts})")
+            books = _wait_for_bids(books, keys['bids'], token, cached_market, 1.0, _has_bid_size)
             continue
 
-        best_bid = float(bids[0]['price'])
-        best_bid_size = float(bids[0].get('size', 0))
+        best_bid, best_bid_size = bids[0]
 
         if best_bid_size <= 0:
-            print(f"[{ts()}] HARD_STOP: No bid size at {best_bid*100:.0f}c, waiting 1s")
-            time.sleep(1)
+            print(f"[{now_ts}] HARD_STOP: No bid size at {best_bid*100:.0f}c, waiting up to 1s")
+            books = _wait_for_bids(books, keys['bids'], token, cached_market, 1.0, _has_bid_size)
             continue
 
         # Log if below floor (but still sell)
         if best_bid < HARD_STOP_FLOOR:
-            print(f"[{ts()}] HARD_STOP: Best bid {best_bid*100:.0f}c below floor {HARD_STOP_FLOOR*100:.0f}c, selling anyway")
+            print(f"[{now_ts}] HARD_STOP: Best bid {best_bid*100:.0f}c below floor {HARD_STOP_FLOOR*100:.0f}c, selling anyway")
 
         # v1.55: Chunk FOK sells to order book depth (don't try to sell more than book can absorb)
-        total_bid_depth = sum(float(b.get('size', 0)) for b in bids)
-        chunk_size = min(remaining_shares, max(total_bid_depth * 0.9, 1))  # 90% of depth, min 1 share
-        print(f"[{ts()}] HARD_STOP: Book depth={total_bid_depth:.0f}, selling chunk={chunk_size:.1f} of {remaining_shares:.0f} remaining")
+        chunk_size, expected_px, total_bid_depth = build_chunk_plan(bids, remaining_shares)  # 90% of depth
+        print(f"[{now_ts}] HARD_STOP: Book depth={total_bid_depth:.0f}, selling chunk={chunk_size:.1f} of {remaining_shares:.0f} remaining")
 
         # Place FOK market sell for chunk (not full position)
-        success, order_id, filled, is_balance_error = place_fok_market_sell(token, chunk_size)
+        success, order_id, filled, is_balance_error = _place_fok_market_sell_unchecked(token, chunk_size)
 
         if success and filled > 0:
-            # Calculate P&L for this fill
-            fill_pnl = (best_bid - entry_price) * filled
+            # Calculate P&L for this fill at the depth-walked price, not just the top bid
+            if abs(filled - chunk_size) < 1e-6 and expected_px > 0:
+                fill_price = expected_px
+            else:
+                fill_price = bid_vwap(bids, filled) or best_bid
+            fill_pnl = (fill_price - entry_price) * filled
             total_pnl += fill_pnl
             remaining_shares -= filled
             balance_errors = 0  # Reset on success
 
-            print(f"[{ts()}] HARD_STOP: Filled {filled:.0f} @ ~{best_bid*100:.0f}c, P&L: ${fill_pnl:.2f}, remaining: {remaining_shares:.0f}")
+            print(f"[{now_ts}] HARD_STOP: Filled {filled:.0f} @ ~{fill_price*100:.1f}c, P&L: ${fill_pnl:.2f}, remaining: {remaining_shares:.0f}")
+            # The fill consumed the depth we just sized against - size the next chunk from a fresh book
+            if remaining_shares > 0 and cached_market:
+                books = get_live_books(cached_market) or books
         elif is_balance_error:
             balance_errors += 1
-            print(f"[{ts()}] HARD_STOP: Balance error #{balance_errors} - shares may already be sold")
+            print(f"[{now_ts}] HARD_STOP: Balance error #{balance_errors} - shares may already be sold")
             if balance_errors >= 3:
-                print(f"[{ts()}] HARD_STOP: 3 consecutive balance errors - shares already sold, stopping")
+                print(f"[{now_ts}] HARD_STOP: 3 consecutive balance errors - shares already sold, stopping")
                 remaining_shares = 0  # Assume sold
                 break
             # Halve the chunk and retry
             remaining_shares = remaining_shares / 2
             if remaining_shares < 1:
-                print(f"[{ts()}] HARD_STOP: Chunk too small after halving, stopping")
+                print(f"[{now_ts}] HARD_STOP: Chunk too small after halving, stopping")
                 remaining_shares = 0
                 break
             time.sleep(0.5)
         else:
-            print(f"[{ts()}] HARD_STOP: FOK rejected, refreshing book (attempt {attempts})")
-            time.sleep(0.5)
-            # Refresh order books for next attempt
-            if window_state.get('cached_market'):
-                books = get_order_books(window_state['cached_market'])
+            print(f"[{now_ts}] HARD_STOP: FOK rejected, refreshing book (attempt {attempts})")
+            # Retry early only if our bids changed since the rejected FOK
+            raw_bids = books.get(keys['bids']) if books else None
+            books = _wait_for_bids(books, keys['bids'], token, cached_market, 0.5,
+                                   lambda fresh: fresh != raw_bids)
 
     if remaining_shares > 0:
         print(f"[{ts()}] HARD_STOP_ERROR: Failed to fully liquidate! {remaining_shares:.0f} shares stuck")
         # Still update state with partial exit
-        window_state[f'capture_99c_filled_{side.lower()}'] = remaining_shares
+        window_state[keys['filled']] = remaining_shares
         return False, total_pnl
 
     # Full liquidation successful
@@ -1579,7 +1965,7 @@ P&L: ${total_pnl:.2f}
     # Update state
     window_state['capture_99c_exited'] = True
     window_state['capture_99c_exit_reason'] = 'hard_stop_60c'
-    window_state[f'capture_99c_filled_{side.lower()}'] = 0
+    window_state[keys['filled']] = 0
 
     return True, total_pnl
 
@@ -1589,76 +1975,118 @@ P&L: ${total_pnl:.2f}
 # ============================================================================
 
 HARD_STOP_MAX_SHARES = 10  # If more than this many shares remain after chunked exit, run a second chunked pass instead of FOK
-
-# Recovery tracking: list of (exit_timestamp, exit_price, side, token, market) tuples
-# Background thread checks prices at +1m, +5m, +15m after each exit
-_recovery_checks_pending = []
+OB_EXIT_MIN_PRICE_FRAC = 0.60  # Chunked passes skip bid levels below 60% of entry; those shares go to FOK cleanup
+
+# Recovery tracking: one scheduler thread samples prices at +1m, +5m, +15m after each exit
+RECOVERY_CHECK_DELAYS = ((60, "+1min"), (300, "+5min"), (900, "+15min"))
+_recovery_heap = []                    # (due_time, seq, job, label) min-heap
+_recovery_seq = itertools.count()      # Tie-breaker so jobs are never compared
+_recovery_cv = threading.Condition()   # Guards _recovery_heap, wakes the scheduler
+_recovery_thread = None
+
+FILL_LOG_FIELDS = ('price', 'size', 'order_id', 'success', 'filled', 'unfilled', 'pnl')
+
+def _new_fill_log():
+    """Empty exit fill log: one parallel list per field (row i is fill i)."""
+    return {k: [] for k in FILL_LOG_FIELDS}
+
+def _append_fill(fill_log, price, size, order_id, success, filled, unfilled, pnl):
+    """Append one chunk result to a fill log from _new_fill_log()."""
+    fill_log['price'].append(price)
+    fill_log['size'].append(size)
+    fill_log['order_id'].append(order_id)
+    fill_log['success'].append(success)
+    fill_log['filled'].append(filled)
+    fill_log['unfilled'].append(unfilled)
+    fill_log['pnl'].append(pnl)
+
+def _extend_fill_log(fill_log, other):
+    """Append every row of `other` onto `fill_log`."""
+    for k in FILL_LOG_FIELDS:
+        fill_log[k].extend(other[k])
 
 def _log_ob_snapshot(side: str, bids_sorted: list):
-    """Log full order book state before exit for post-hoc analysis."""
+    """Log full order book state before exit for post-hoc analysis.
+
+    `bids_sorted` is best-first (price, size) tuples from parse_levels().
+    """
     print(f"[{ts()}] OB_SNAPSHOT ({side}) — {len(bids_sorted)} bid levels:")
     total_depth = 0
-    for level in bids_sorted:
-        price = float(level['price'])
-        size = float(level['size'])
+    for price, size in bids_sorted:
         total_depth += size
         print(f"[{ts()}]   {price*100:6.1f}c | {size:>10.1f} shares | cumulative: {total_depth:.0f}")
     print(f"[{ts()}] OB_SNAPSHOT TOTAL: {total_depth:.0f} shares across {len(bids_sorted)} levels")
 
-def _schedule_recovery_check(exit_time: float, exit_price: float, side: str):
-    """Schedule background recovery price checks at +1m, +5m, +15m after exit."""
-    import threading
-
-    def _check():
-        delays = [(60, "+1min"), (300, "+5min"), (900, "+15min")]
-        results = {}
-        for delay_sec, label in delays:
-            wait = exit_time + delay_sec - time.time()
-            if wait > 0:
-                time.sleep(wait)
-            # Fetch current best bid for this side
-            try:
-                slug, _ = get_current_slug()
-                market = get_market_data(slug)
-                if market:
-                    fresh_books = get_order_books(market)
-                    if fresh_books:
-                        bids = fresh_books.get(f'{side.lower()}_bids', [])
-                        if bids:
-                            price = float(bids[0]['price'])
-                            results[label] = price
-                        else:
-                            results[label] = 0.0
-                    else:
-                        results[label] = 0.0
-                else:
-                    results[label] = 0.0
-            except Exception:
-                results[label] = 0.0
-
-        p1 = results.get("+1min", 0)
-        p5 = results.get("+5min", 0)
-        p15 = results.get("+15min", 0)
-        recovered = "YES" if max(p1, p5, p15) >= 0.80 else "NO"
-
-        line = (f"RECOVERY CHECK: [{ts()}] | Exit price: {exit_price*100:.0f}c "
-                f"| Price at +1min: {p1*100:.0f}c | Price at +5min: {p5*100:.0f}c "
-                f"| Price at +15min: {p15*100:.0f}c | Would have recovered: {recovered}")
-        print(f"[{ts()}] {line}")
-        log_activity("RECOVERY_CHECK", {
-            "exit_price": exit_price, "side": side,
-            "price_1m": p1, "price_5m": p5, "price_15m": p15,
-            "recovered": recovered
-        })
+def _recovery_best_bid(side: str) -> float:
+    """Current best bid for `side` in the live window, or 0.0 if unavailable."""
+    try:
+        slug, _ = get_current_slug()
+        market = get_market_data(slug)
+        if market:
+            fresh_books = get_order_books(market)
+            if fresh_books:
+                bids = fresh_books.get(f'{side.lower()}_bids', [])
+                if bids:
+                    return float(bids[0]['price'])
+    except Exception:
+        pass
+    return 0.0
 
-    t = threading.Thread(target=_check, daemon=True)
-    t.start()
+def _run_recovery_step(job: dict, label: str):
+    """Record one recovery price sample; log the verdict after the last one."""
+    job['results'][label] = _recovery_best_bid(job['side'])
+    if len(job['results']) < len(RECOVERY_CHECK_DELAYS):
+        return
 
+    results = job['results']
+    exit_price = job['exit_price']
+    side = job['side']
+    p1 = results.get("+1min", 0)
+    p5 = results.get("+5min", 0)
+    p15 = results.get("+15min", 0)
+    recovered = "YES" if max(p1, p5, p15) >= 0.80 else "NO"
+
+    line = (f"RECOVERY CHECK: [{ts()}] | Exit price: {exit_price*100:.0f}c "
+            f"| Price at +1min: {p1*100:.0f}c | Price at +5min: {p5*100:.0f}c "
+            f"| Price at +15min: {p15*100:.0f}c | Would have recovered: {recovered}")
+    print(f"[{ts()}] {line}")
+    log_activity("RECOVERY_CHECK", {
+        "exit_price": exit_price, "side": side,
+        "price_1m": p1, "price_5m": p5, "price_15m": p15,
+        "recovered": recovered
+    })
 
-def _walk_bids(side: str, token: str, entry_price: float, remaining: float, pass_label: str) -> tuple:
+def _recovery_scheduler():
+    """Single background thread: run recovery samples from the heap as they come due."""
+    while True:
+        with _recovery_cv:
+            while not _recovery_heap or _recovery_heap[0][0] > time.time():
+                _recovery_cv.wait(_recovery_heap[0][0] - time.time() if _recovery_heap else None)
+            _, _, job, label = heapq.heappop(_recovery_heap)
+        try:
+            _run_recovery_step(job, label)
+        except Exception as e:
+            print(f"[{ts()}] RECOVERY_CHECK_ERROR: {e}")
+
+def _schedule_recovery_check(exit_time: float, exit_price: float, side: str):
+    """Schedule background recovery price checks at +1m, +5m, +15m after exit."""
+    global _recovery_thread
+    job = {'exit_price': exit_price, 'side': side, 'results': {}}
+    with _recovery_cv:
+        for delay_sec, label in RECOVERY_CHECK_DELAYS:
+            heapq.heappush(_recovery_heap, (exit_time + delay_sec, next(_recovery_seq), job, label))
+        if _recovery_thread is None:
+            _recovery_thread = threading.Thread(target=_recovery_scheduler, daemon=True)
+            _recovery_thread.start()
+        _recovery_cv.notify()
+
+
+def _walk_bids(side: str, token: str, entry_price: float, remaining: float, pass_label: str,
+               min_price: float = 0.0) -> tuple:
     """
     Walk the order book bid levels top-down, placing limit sells matched to
-    each level's available size. Re-fetches the order book every 3 chunks.
+    each level's available size. Every level in a snapshot is sold at once;
+    the order book is re-fetched before the next batch.
 
     Args:
         side: "UP" or "DOWN"
@@ -1666,31 +2094,31 @@ def _walk_bids(side: str, token: str, entry_price: float, remaining: float, pass
         entry_price: Entry price for P&L calculation
         remaining: Shares left to sell
         pass_label: "PASS_1" or "PASS_2" for log clarity
+        min_price: Don't sell into bid levels below this price (0 = any price)
 
     Returns:
         tuple: (confirmed_filled, total_pnl, remaining, fill_log, orders_placed, pending_order_ids)
     """
     OB_EXIT_FILL_TIMEOUT = 3.0
     OB_EXIT_POLL_INTERVAL = 0.5
-    OB_REFRESH_EVERY = 3  # Re-fetch order book every N chunks
 
     confirmed_filled = 0.0
     total_pnl = 0.0
-    fill_log = []
+    fill_log = _new_fill_log()
     orders_placed = 0
     pending_order_ids = []
-    chunks_since_refresh = 0
+    done_ids = set()  # Orders confirmed fully filled - nothing left to cancel
 
     # Fetch initial order book
-    books = get_order_books(window_state['cached_market']) if window_state.get('cached_market') else None
+    books = get_live_books(window_state['cached_market']) if window_state.get('cached_market') else None
     if books is None:
-        return 0.0, 0.0, remaining, [], 0, []
+        return 0.0, 0.0, remaining, fill_log, 0, []
 
-    bids_key = f'{side.lower()}_bids'
+    bids_key = SIDE_KEYS[side]['bids']
 
     while remaining > 0:
-        # Refresh order book every OB_REFRESH_EVERY chunks
-        if chunks_since_refresh >= OB_REFRESH_EVERY and window_state.get('cached_market'):
+        # Refresh order book after every batch - the last snapshot's levels are spent
+        if orders_placed and window_state.get('cached_market'):
             print(f"[{ts()}] OB REFRESH: [{pass_label}] Chunks placed so far: {orders_placed} "
                   f"| Confirmed fills so far: {confirmed_filled:.0f} shares "
                   f"| Remaining: {remaining:.0f} shares | Refreshing order book")
@@ -1698,79 +2126,81 @@ def _walk_bids(side: str, token: str, entry_price: float, remaining: float, pass
                 "pass": pass_label, "orders_placed": orders_placed,
                 "confirmed_filled": confirmed_filled, "remaining": remaining
             })
-            books = get_order_books(window_state['cached_market'])
+            books = get_live_books(window_state['cached_market'])
             if books is None:
                 print(f"[{ts()}] OB_EXIT [{pass_label}]: Refresh failed, stopping walk")
                 break
-            chunks_since_refresh = 0
 
-        bids = books.get(bids_key, [])
-        bids_sorted = sorted(bids, key=lambda x: float(x['price']), reverse=True)
+        # Books are already best-first; convert levels to floats once
+        bids_sorted = parse_levels(books.get(bids_key, []))
 
         if not bids_sorted:
             print(f"[{ts()}] OB_EXIT [{pass_label}]: No bids remaining in book")
             break
 
-        # Walk current snapshot
-        made_progress = False
-        for level in bids_sorted:
-            if remaining <= 0:
-                break
-
-            bid_price = float(level['price'])
-            bid_size = float(level['size'])
-
-            if bid_size <= 0:
-                continue
-
-            chunk = min(bid_size, remaining)
+        # Plan one sell per level for this snapshot, top-down until the position is covered
+        plans = plan_bid_walk(bids_sorted, remaining, min_price)
+        if sum(chunk for _, chunk in plans) < remaining and bids_sorted[-1][0] < min_price:
+            print(f"[{ts()}] OB_EXIT [{pass_label}]: Skipping bid levels below floor {min_price*100:.0f}c")
+        if not plans:
+            break
 
-            print(f"[{ts()}] OB_EXIT [{pass_label}]: Selling {chunk:.1f} @ {bid_price*100:.0f}c (bid depth: {bid_size:.0f})")
+        now_ts = ts()
+        print("\n".join(f"[{now_ts}] OB_EXIT [{pass_label}]: Selling {chunk:.1f} @ {bid_price*100:.0f}c"
+                        for bid_price, chunk in plans))
 
-            success, result = place_limit_order(token, bid_price, chunk, side="SELL")
+        # Place the whole snapshot concurrently
+        results = list(_ORDER_POOL.map(
+            lambda plan: place_limit_order(token, plan[0], plan[1], side="SELL"), plans))
 
+        placed = []  # (bid_price, chunk, order_id)
+        for (bid_price, chunk), (success, result) in zip(plans, results):
             if not success:
-                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> ORDER FAILED: {result}")
-                fill_log.append({"price": bid_price, "size": chunk, "order_id": None,
-                                 "success": False, "filled": 0})
+                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> ORDER FAILED @ {bid_price*100:.0f}c: {result}")
+                _append_fill(fill_log, bid_price, chunk, None, False, 0, chunk, 0)
                 continue
-
             orders_placed += 1
-            chunks_since_refresh += 1
-            order_id = result
-            pending_order_ids.append(order_id)
-            made_progress = True
-
-            # Wait for fill confirmation with timeout
-            filled_shares = 0.0
-            fill_start = time.time()
-            while time.time() - fill_start < OB_EXIT_FILL_TIMEOUT:
-                status = get_order_status(order_id)
-                filled_shares = status.get('filled', 0)
-                if status.get('fully_filled'):
-                    break
-                time.sleep(OB_EXIT_POLL_INTERVAL)
-
-            # Final status check
-            if filled_shares <= 0:
-                status = get_order_status(order_id)
-                filled_shares = status.get('filled', 0)
+            pending_order_ids.append(result)
+            placed.append((bid_price, chunk, result))
+
+        # If nothing in the snapshot could be placed, stop
+        if not placed:
+            break
 
+        # Wait for fill confirmation on all orders together, with one shared timeout
+        statuses = {}
+        open_ids = [order_id for _, _, order_id in placed]
+        fill_start = time.time()
+        while open_ids and time.time() - fill_start < OB_EXIT_FILL_TIMEOUT:
+            for order_id, status in zip(open_ids, _ORDER_POOL.map(get_order_status, open_ids)):
+                statuses[order_id] = status
+            done_ids.update(oid for oid in open_ids if statuses[oid].get('fully_filled'))
+            open_ids = [oid for oid in open_ids if oid not in done_ids]
+            if open_ids:
+                wait_for_order_fills(open_ids, OB_EXIT_POLL_INTERVAL)
+
+        # The last poll is already final - re-check only orders whose status errored
+        error_ids = [oid for _, _, oid in placed
+                     if statuses.get(oid, {'status': 'ERROR'}).get('status') == 'ERROR']
+        for order_id, status in zip(error_ids, _ORDER_POOL.map(get_order_status, error_ids)):
+            statuses[order_id] = status
+
+        to_cancel = []
+        for bid_price, chunk, order_id in placed:
+            oid_short = order_id[:8]
+            price_c = bid_price * 100
+            filled_shares = statuses[order_id].get('filled', 0)
             chunk_pnl = (bid_price - entry_price) * filled_shares if filled_shares > 0 else 0
             unfilled = chunk - filled_shares
 
-            fill_log.append({
-                "price": bid_price, "size": chunk, "order_id": order_id,
-                "success": True, "filled": filled_shares, "unfilled": unfilled,
-                "pnl": chunk_pnl,
-            })
+            _append_fill(fill_log, bid_price, chunk, order_id, True, filled_shares, unfilled, chunk_pnl)
 
             if filled_shares > 0:
                 confirmed_filled += filled_shares
                 total_pnl += chunk_pnl
                 remaining -= filled_shares
-                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> FILLED: {filled_shares:.0f}/{chunk:.0f} @ {bid_price*100:.0f}c "
-                      f"(P&L: ${chunk_pnl:+.2f}) [ID: {order_id[:8]}...]")
+                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> FILLED: {filled_shares:.0f}/{chunk:.0f} @ {price_c:.0f}c "
+                      f"(P&L: ${chunk_pnl:+.2f}) [ID: {oid_short}...]")
                 log_activity("OB_EXIT_CHUNK", {
                     "pass": pass_label, "side": side, "price": bid_price,
                     "size": chunk, "filled": filled_shares,
@@ -1778,29 +2208,19 @@ def _walk_bids(side: str, token: str, entry_price: float, remaining: float, pass
                     "remaining": remaining
                 })
             else:
-                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> NOT FILLED in {OB_EXIT_FILL_TIMEOUT}s, cancelling [ID: {order_id[:8]}...]")
+                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> NOT FILLED in {OB_EXIT_FILL_TIMEOUT}s, cancelling [ID: {oid_short}...]")
 
-            # Cancel unfilled portion immediately
             if unfilled > 0:
-                cancel_order(order_id)
-                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> Cancelled {unfilled:.0f} unfilled @ {bid_price*100:.0f}c")
-
-            # Check if we need an OB refresh mid-walk
-            if chunks_since_refresh >= OB_REFRESH_EVERY and remaining > 0:
-                break  # Break inner for-loop to trigger refresh in outer while-loop
+                to_cancel.append((order_id, price_c, unfilled))
 
-        # If we walked the entire snapshot without placing any orders, stop
-        if not made_progress:
-            break
+        # Cancel unfilled portions immediately, all at once
+        if to_cancel:
+            cancel_orders([oid for oid, _, _ in to_cancel])
+            for _, price_c, unfilled in to_cancel:
+                print(f"[{ts()}] OB_EXIT [{pass_label}]:   -> Cancelled {unfilled:.0f} unfilled @ {price_c:.0f}c")
 
-    # Safety sweep: cancel any remaining open orders
-    for oid in pending_order_ids:
-        try:
-            status = get_order_status(oid)
-            if not status.get('fully_filled') and status.get('status') not in ('CANCELLED', 'EXPIRED'):
-                cancel_order(oid)
-        except Exception:
-            pass
+    # Safety sweep: cancel any remaining open orders (cancelling a dead order is a no-op)
+    cancel_orders([oid for oid in pending_order_ids if oid not in done_ids])
 
     return confirmed_filled, total_pnl, remaining, fill_log, orders_placed, pending_order_ids
 
@@ -1824,15 +2244,16 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
         books: Order book data (will be fetched fresh regardless)
 
     Returns:
-        tuple: (success, total_pnl, fill_log)
+        tuple: (success, total_pnl, fill_log) - fill_log is column lists, see _new_fill_log()
     """
     global window_state
 
     exit_start = time.time()
+    keys = SIDE_KEYS[side]
 
     # --- Determine shares to sell ---
-    tracked_shares = window_state.get(f'capture_99c_filled_{side.lower()}', 0)
-    api_pos = verify_position_from_api()
+    tracked_shares = window_state.get(keys['filled'], 0)
+    api_pos = get_cached_position()
 
     if api_pos is not None:
         actual_shares = api_pos[0] if side == 'UP' else api_pos[1]
@@ -1845,19 +2266,19 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
 
     if shares <= 0:
         print(f"[{ts()}] OB_EXIT: No shares to sell for {side}")
-        return False, 0.0, []
+        return False, 0.0, _new_fill_log()
 
-    token = window_state.get(f'{side.lower()}_token')
+    token = window_state.get(keys['token'])
     entry_price = window_state.get('capture_99c_fill_price', 0.99)
 
-    # --- Fetch FRESH order book for initial snapshot log ---
+    # --- Fresh order book (live WS feed, REST fallback) for initial snapshot log ---
     if window_state.get('cached_market'):
-        books = get_order_books(window_state['cached_market'])
+        books = get_live_books(window_state['cached_market'])
 
     if books is None:
         print(f"[{ts()}] OB_EXIT: Cannot fetch order book, falling back to hard stop")
         hs_success, hs_pnl = execute_hard_stop(side, {})
-        return hs_success, hs_pnl, []
+        return hs_success, hs_pnl, _new_fill_log()
 
     print()
     print("=" * 55)
@@ -1866,22 +2287,25 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
     print("=" * 55)
 
     # --- Order book snapshot before any orders ---
-    bids_key = f'{side.lower()}_bids'
-    bids_sorted = sorted(books.get(bids_key, []), key=lambda x: float(x['price']), reverse=True)
+    bids_sorted = parse_levels(books.get(keys['bids'], []))
     _log_ob_snapshot(side, bids_sorted)
 
     if not bids_sorted:
         print(f"[{ts()}] OB_EXIT: No bids in book, falling back to hard stop")
         hs_success, hs_pnl = execute_hard_stop(side, books)
-        return hs_success, hs_pnl, []
+        return hs_success, hs_pnl, _new_fill_log()
 
     # ========== FIRST PASS ==========
     print(f"[{ts()}] OB_EXIT: Starting PASS 1 — {shares:.0f} shares to sell")
+    min_price = entry_price * OB_EXIT_MIN_PRICE_FRAC
     p1_filled, p1_pnl, remaining, p1_log, p1_orders, _ = _walk_bids(
-        side, token, entry_price, shares, "PASS_1")
+        side, token, entry_price, shares, "PASS_1", min_price)
+    if p1_filled > 0:
+        invalidate_position_cache()  # The FOK cleanup below must not size from a pre-walk position
 
     total_pnl = p1_pnl
-    all_fills = list(p1_log)
+    all_fills = _new_fill_log()
+    _extend_fill_log(all_fills, p1_log)
     total_orders = p1_orders
     confirmed_filled = p1_filled
 
@@ -1896,17 +2320,19 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
         })
 
         p2_filled, p2_pnl, remaining, p2_log, p2_orders, _ = _walk_bids(
-            side, token, entry_price, remaining, "PASS_2")
+            side, token, entry_price, remaining, "PASS_2", min_price)
+        if p2_filled > 0:
+            invalidate_position_cache()
 
         total_pnl += p2_pnl
-        all_fills.extend(p2_log)
+        _extend_fill_log(all_fills, p2_log)
         total_orders += p2_orders
         confirmed_filled += p2_filled
 
     # ========== FOK CLEANUP (if <=HARD_STOP_MAX_SHARES remain) ==========
     if 0 < remaining <= HARD_STOP_MAX_SHARES:
         print(f"[{ts()}] OB_EXIT: {remaining:.0f} shares remain (<= {HARD_STOP_MAX_SHARES}), using FOK to clean up")
-        window_state[f'capture_99c_filled_{side.lower()}'] = remaining
+        window_state[keys['filled']] = remaining
         hs_success, hs_pnl = execute_hard_stop(side, books)
         total_pnl += hs_pnl
         if hs_success:
@@ -1914,7 +2340,7 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
     elif remaining > HARD_STOP_MAX_SHARES:
         # Both passes exhausted and still >HARD_STOP_MAX_SHARES remain — FOK as last resort
         print(f"[{ts()}] OB_EXIT: {remaining:.0f} shares STILL remain after 2 passes, FOK last resort")
-        window_state[f'capture_99c_filled_{side.lower()}'] = remaining
+        window_state[keys['filled']] = remaining
         hs_success, hs_pnl = execute_hard_stop(side, books)
         total_pnl += hs_pnl
         if hs_success:
@@ -1931,7 +2357,7 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
         lr_filled, lr_pnl, remaining, lr_log, lr_orders, _ = _walk_bids(
             side, token, entry_price, remaining, "LAST_RESORT_CHUNKED")
         total_pnl += lr_pnl
-        all_fills.extend(lr_log)
+        _extend_fill_log(all_fills, lr_log)
         total_orders += lr_orders
         confirmed_filled += lr_filled
         if remaining <= 0:
@@ -1945,13 +2371,13 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
             time.sleep(10)
 
             # Re-fetch book for current best bid
-            lr_books = get_order_books(window_state['cached_market']) if window_state.get('cached_market') else None
+            lr_books = get_live_books(window_state['cached_market']) if window_state.get('cached_market') else None
             lr_bids = []
             best_bid_price = 0
             if lr_books:
-                lr_bids = lr_books.get(f'{side.lower()}_bids', [])
+                lr_bids = lr_books.get(keys['bids'], [])
                 if lr_bids:
-                    best_bid_price = float(sorted(lr_bids, key=lambda x: float(x['price']), reverse=True)[0]['price'])
+                    best_bid_price = float(lr_bids[0]['price'])  # books are best-first
 
             print(f"[{ts()}] LAST RESORT: Attempt {lr_attempt} | Shares remaining: {remaining:.0f} "
                   f"| Best bid: {best_bid_price*100:.0f}c")
@@ -1967,7 +2393,7 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
                 continue
 
             # Try FOK for remaining shares
-            window_state[f'capture_99c_filled_{side.lower()}'] = remaining
+            window_state[keys['filled']] = remaining
             fok_success, fok_oid, fok_filled, fok_bal_err = place_fok_market_sell(token, remaining)
 
             if fok_success and fok_filled > 0:
@@ -2007,15 +2433,20 @@ def execute_ob_exit(side: str, books: dict = None) -> tuple:
     # --- EXIT SUMMARY ---
     exit_elapsed_ms = (time.time() - exit_start) * 1000
 
-    if all_fills:
-        prices = [f["price"] for f in all_fills if f.get("filled", 0) > 0]
-        sizes = [f["filled"] for f in all_fills if f.get("filled", 0) > 0]
-        if prices:
-            avg_fill = sum(p * s for p, s in zip(prices, sizes)) / sum(sizes)
-            best_fill = max(prices)
-            worst_fill = min(prices)
-        else:
-            avg_fill = best_fill = worst_fill = 0
+    # One pass over the fills for VWAP, best and worst
+    fill_notional = fill_size = 0.0
+    best_fill = 0
+    worst_fill = float('inf')
+    for price, filled in zip(all_fills['price'], all_fills['filled']):
+        if filled > 0:
+            fill_notional += price * filled
+            fill_size += filled
+            if price > best_fill:
+                best_fill = price
+            if price < worst_fill:
+                worst_fill = price
+    if fill_size > 0:
+        avg_fill = fill_notional / fill_size
     else:
         avg_fill = best_fill = worst_fill = 0
 
@@ -2055,17 +2486,17 @@ P&L: ${total_pnl:+.2f} ({exit_elapsed_ms:.0f}ms)"""
     send_telegram(msg)
 
     # --- Recovery tracking ---
-    exit_bid = float(bids_sorted[0]['price']) if bids_sorted else HARD_STOP_TRIGGER
+    exit_bid = bids_sorted[0][0] if bids_sorted else HARD_STOP_TRIGGER
     _schedule_recovery_check(time.time(), exit_bid, side)
 
     # --- Update state ---
     if remaining <= 0:
         window_state['capture_99c_exited'] = True
         window_state['capture_99c_exit_reason'] = 'ob_exit'
-        window_state[f'capture_99c_filled_{side.lower()}'] = 0
+        window_state[keys['filled']] = 0
         return True, total_pnl, all_fills
     else:
-        window_state[f'capture_99c_filled_{side.lower()}'] = remaining
+        window_state[keys['filled']] = remaining
         return False, total_pnl, all_fills
 
 
@@ -2077,6 +2508,17 @@ def cancel_order(order_id):
         print(f"[{ts()}] CANCEL_ORDER_ERROR: {order_id[:8]}... - {e}")
         return False
 
+def cancel_orders(order_ids):
+    """Cancel several orders in one request, falling back to parallel single cancels."""
+    if not order_ids:
+        return True
+    try:
+        clob_client.cancel_orders(list(order_ids))
+        return True
+    except Exception as e:
+        print(f"[{ts()}] CANCEL_ORDERS_ERROR: {len(order_ids)} orders - {e}, cancelling individually")
+        return all(_ORDER_POOL.map(cancel_order, order_ids))
+
 def cancel_all_orders():
     try:
         clob_client.cancel_all()
@@ -2085,6 +2527,9 @@ def cancel_all_orders():
         print(f"[{ts()}] CANCEL_ALL_ERROR: {e}")
         return False
 
+# get_order_status() result when the status can't be read
+_ORDER_STATUS_ERROR = {'filled': 0, 'original': 0, 'is_filled': False, 'fully_filled': False, 'price': 0, 'status': 'ERROR'}
+
 def get_order_status(order_id):
     try:
         order = clob_client.get_order(order_id)
@@ -2101,7 +2546,26 @@ def get_order_status(order_id):
             }
     except Exception as e:
         print(f"[{ts()}] ORDER_STATUS_ERROR: {order_id[:8]}... - {e}")
-    return {'filled': 0, 'original': 0, 'is_filled': False, 'fully_filled': False, 'price': 0, 'status': 'ERROR'}
+    return dict(_ORDER_STATUS_ERROR)
+
+def wait_for_order_status(order_id, timeout, until_done=False):
+    """
+    get_order_status() after waiting up to `timeout` seconds for the order to settle.
+
+    With the user feed connected the wait ends as soon as the exchange reports the
+    order (or, with until_done, its full fill/cancel); otherwise it's a plain sleep.
+    """
+    if USER_FEED_AVAILABLE and user_feed.is_connected():
+        user_feed.wait_for_order(order_id, timeout, until_done)
+    else:
+        time.sleep(timeout)
+    return get_order_status(order_id)
+
+def feed_order_status(order_id):
+    """get_order_status()-shaped view of the user feed's last event for an order, or None (use REST)."""
+    if not USER_FEED_AVAILABLE:
+        return None
+    return user_feed.order_status(order_id)
 
 def get_verified_fill_price(slug, side, fallback_price):
     """Query Polymarket /trades API for actual execution price (not limit order price)."""
@@ -2126,24 +2590,57 @@ def get_verified_fill_price(slug, side, fallback_price):
         print(f"[{ts()}] PRICE_VERIFY_ERROR: {e}")
     return fallback_price
 
+def check_both_orders_async(up_order_id, down_order_id):
+    """Start both order-status checks and return (up_future, down_future) without waiting.
+
+    A missing order ID yields None in its slot. Read results with _future_result() when needed.
+    """
+    up_future = _ORDER_POOL.submit(get_order_status, up_order_id) if up_order_id else None
+    down_future = _ORDER_POOL.submit(get_order_status, down_order_id) if down_order_id else None
+    return up_future, down_future
+
+def _future_result(future, default, timeout=5):
+    """Result of a pool future, or `default` if it is missing, raised, or timed out."""
+    if future is None:
+        return default
+    try:
+        return future.result(timeout=timeout)
+    except Exception as e:
+        print(f"[{ts()}] ASYNC_CHECK_FAILED: {type(e).__name__}: {e}")
+        return default
+
 def check_both_orders_fast(up_order_id, down_order_id):
-    with ThreadPoolExecutor(max_workers=2) as ex:
-        up_future = ex.submit(get_order_status, up_order_id)
-        down_future = ex.submit(get_order_status, down_order_id)
-        up_status = up_future.result(timeout=5)
-        down_status = down_future.result(timeout=5)
-    return up_status, down_status
+    up_future, down_future = check_both_orders_async(up_order_id, down_order_id)
+    return (_future_result(up_future, dict(_ORDER_STATUS_ERROR)),
+            _future_result(down_future, dict(_ORDER_STATUS_ERROR)))
 
 # ============================================================================
 # POSITION VERIFICATION
 # ============================================================================
 
+POSITION_REFRESH_INTERVAL = 1.0  # Background position poll interval while holding a 99c position
+POSITION_CACHE_MAX_AGE = 2.0     # Exit paths use the cached position if it's at most this old
+POSITION_DEDUPE_AGE = 0.2        # Entry checks reuse a position fetched within the same tick
+
+# Last position seen by verify_position_from_api() - replaced wholesale, never mutated.
+# ts is when that fetch started, so a read in flight across one of our fills counts as stale.
+_position_cache = {"tokens": None, "pos": None, "ts": 0.0}
+_position_stale_before = 0.0  # Cached reads started before this are not served
+
+def invalidate_position_cache():
+    """Stop serving cached positions fetched so far (call when our own orders fill)."""
+    global _position_stale_before
+    _position_stale_before = time.time()
+
 def verify_position_from_api():
     """Verify actual position from API before placing orders"""
+    global _position_cache
+    started = time.time()
     try:
         url = f"https://data-api.polymarket.com/positions?user={WALLET_ADDRESS.lower()}"
-        resp = requests.get(url, timeout=5)
-        positions = resp.json()
+        resp = http_session.get(url, timeout=5)
+        resp.raise_for_status()
+        positions = _resp_json(resp)
 
         up_shares = 0
         down_shares = 0
@@ -2163,17 +2660,55 @@ def verify_position_from_api():
                 elif asset == down_token:
                     down_shares = size
 
+        _position_cache = {"tokens": (up_token, down_token),
+                           "pos": (up_shares, down_shares), "ts": started}
         return up_shares, down_shares
     except Exception as e:
         print(f"[{ts()}] API_POSITION_ERROR: {e}")
         return None
 
+def _fresh_cached_position(max_age):
+    """Last API position for the current tokens if at most `max_age` seconds old, else None."""
+    cache = _position_cache
+    if (cache["pos"] is not None
+            and cache["ts"] > _position_stale_before
+            and cache["tokens"] == (window_state.get('up_token'), window_state.get('down_token'))
+            and time.time() - cache["ts"] <= max_age):
+        return cache["pos"]
+    return None
+
+def get_cached_position(max_age=POSITION_CACHE_MAX_AGE):
+    """Position from the background refresher if fresh, else a live API query."""
+    pos = _fresh_cached_position(max_age)
+    if pos is not None:
+        return pos
+    return verify_position_from_api()
+
+def _position_refresher():
+    """Background thread: keep _position_cache warm while a 99c position is open."""
+    while True:
+        try:
+            if (window_state and window_state.get('capture_99c_fill_notified')
+                    and not window_state.get('capture_99c_exited')):
+                verify_position_from_api()
+        except Exception as e:
+            print(f"[{ts()}] POSITION_REFRESH_ERROR: {e}")
+        time.sleep(POSITION_REFRESH_INTERVAL)
+
 # ============================================================================
 # BUG FIX: VERIFIED POSITION WITH RETRY
 # ============================================================================
 
-def get_verified_position():
-    """Get position with retry and validation - Bug Fix #2"""
+def get_verified_position(max_age=0):
+    """Get position with retry and validation - Bug Fix #2
+
+    With max_age > 0, a position already fetched within that many seconds is
+    returned without another API call.
+    """
+    if max_age > 0:
+        pos = _fresh_cached_position(max_age)
+        if pos is not None:
+            return pos
     for attempt in range(ORDER_VERIFY_RETRIES):
         api_pos = verify_position_from_api()
         if api_pos is not None:
@@ -2189,22 +2724,19 @@ def get_verified_fills():
     """
     global window_state
 
+    # Sources 1 and 2 are independent REST calls - issue them together
+    arb = window_state.get('current_arb_orders') or {}
+    up_future, down_future = check_both_orders_async(arb.get('up_id'), arb.get('down_id'))
+    pos_future = _ORDER_POOL.submit(verify_position_from_api)
+
     # Source 1: Check order status for pending arb orders
-    order_up_filled = 0
-    order_down_filled = 0
-
-    if window_state.get('current_arb_orders'):
-        arb = window_state['current_arb_orders']
-        if arb.get('up_id'):
-            up_status = get_order_status(arb['up_id'])
-            order_up_filled = up_status.get('filled', 0)
-        if arb.get('down_id'):
-            down_status = get_order_status(arb['down_id'])
-            order_down_filled = down_status.get('filled', 0)
+    # A slow or failed check counts as no fills, as when these ran one after another
+    order_up_filled = (_future_result(up_future, None) or {}).get('filled', 0)
+    order_down_filled = (_future_result(down_future, None) or {}).get('filled', 0)
 
     # Source 2: Position API
     api_up, api_down = 0, 0
-    pos = verify_position_from_api()
+    pos = _future_result(pos_future, None)
     if pos:
         api_up, api_down = pos
 
@@ -2275,15 +2807,18 @@ def place_and_verify_order(token_id, price, size, side="BUY", bypass_price_fails
         print(f"[{ts()}] [HALT] BLOCKED: {side} @ {price*100:.0f}c x{size} - trading halted (ROI target reached)")
         return False, None, "HALTED"
 
-    # Check for duplicate first
+    # Check for duplicate first - sign the order while the open-orders query is in flight
     order_side = "UP" if token_id == window_state.get('up_token') else "DOWN"
-    pending, pending_id = has_pending_order(order_side)
+    pending_future = _ORDER_POOL.submit(has_pending_order, order_side)
+    signed_order = sign_limit_order(token_id, price, size, side)
+    pending, pending_id = pending_future.result()
     if pending:
         print(f"[{ts()}] SKIP_DUPLICATE: Already have pending {order_side} order {pending_id}")
         return False, None, "DUPLICATE"
 
     # Place the order
-    success, result = place_limit_order(token_id, price, size, side, bypass_price_failsafe)
+    success, result = place_limit_order(token_id, price, size, side, bypass_price_failsafe,
+                                        signed_order=signed_order)
 
     if not success:
         # result contains the error message
@@ -2296,14 +2831,19 @@ def place_and_verify_order(token_id, price, size, side="BUY", bypass_price_fails
 
     order_id = result
 
-    # Verify order exists on exchange
-    time.sleep(0.5)
-    status = get_order_status(order_id)
+    # The user feed's PLACEMENT event already carries the accepted size - no REST round trip
+    feed_live = USER_FEED_AVAILABLE and user_feed.is_connected()
+    if feed_live and user_feed.wait_for_order(order_id, 0.5):
+        feed_state = user_feed.get_order(order_id)
+        if feed_state and feed_state['original'] > 0:
+            return True, order_id, "PLACED"
+
+    # Verify order exists on exchange (a feed wait above has already spent the settle time)
+    status = get_order_status(order_id) if feed_live else wait_for_order_status(order_id, 0.5)
 
     if status['status'] == 'UNKNOWN' or status['status'] == 'ERROR':
         # Order may not have propagated - retry check
-        time.sleep(1.0)
-        status = get_order_status(order_id)
+        status = wait_for_order_status(order_id, 1.0)
 
     if status['original'] > 0:
         return True, order_id, "PLACED"
@@ -2326,11 +2866,9 @@ def calculate_hedge_price(fill_price, seconds_since_fill):
     # Profit target: 99c combined (1c profit)
     profit_target_price = 0.99 - fill_price  # e.g., 0.99 - 0.57 = 0.42 (42c)
 
-    # Find current tolerance based on time elapsed
-    tolerance_cents = 0
-    for threshold_secs, tol_cents in HEDGE_ESCALATION:
-        if seconds_since_fill >= threshold_secs:
-            tolerance_cents = tol_cents  # e.g. 2 for 2c tolerance
+    # Find current tolerance based on time elapsed (last threshold <= elapsed)
+    idx = bisect_right(_HEDGE_THRESHOLDS, seconds_since_fill) - 1
+    tolerance_cents = _HEDGE_TOLS[idx] if idx >= 0 else 0  # e.g. 2 for 2c tolerance
 
     # Convert tolerance to decimal
     tolerance = tolerance_cents / 100.0
@@ -2341,6 +2879,9 @@ def calculate_hedge_price(fill_price, seconds_since_fill):
     # Cap at 50c max
     return min(max_hedge, HEDGE_PRICE_CAP), tolerance_cents
 
+
+_BAIL_LOSS_REASON = f"LOSS_EXCEEDED_{int(BAIL_LOSS_THRESHOLD*100)}PCT"
+
 def should_trigger_bail(fill_price, current_ask, seconds_since_fill, ttc, is_hedged):
     """Check if bail mode should trigger"""
     # If already hedged (paired), no need to bail
@@ -2348,8 +2889,9 @@ def should_trigger_bail(fill_price, current_ask, seconds_since_fill, ttc, is_hed
         return False, None
 
     # Trigger 1: Unhedged too long AND hedge would exceed cap
-    hedge_needed, _ = calculate_hedge_price(fill_price, seconds_since_fill)
-    if seconds_since_fill > BAIL_UNHEDGED_TIMEOUT and hedge_needed >= HEDGE_PRICE_CAP:
+    # (hedge price only computed once the timeout has actually passed)
+    if (seconds_since_fill > BAIL_UNHEDGED_TIMEOUT and
+            calculate_hedge_price(fill_price, seconds_since_fill)[0] >= HEDGE_PRICE_CAP):
         return True, "UNHEDGED_TIMEOUT_HIGH_HEDGE"
 
     # Trigger 2: <90 seconds until close AND still unhedged
@@ -2357,46 +2899,43 @@ def should_trigger_bail(fill_price, current_ask, seconds_since_fill, ttc, is_hed
         return True, "TIME_CRITICAL"
 
     # Trigger 3: Position down >5% (current ask much higher than fill = bad)
-    if fill_price > 0:
-        # If we bought at 40c and now ask is 50c, we'd have to pay 10c more = 25% loss
-        potential_loss_pct = (current_ask - fill_price) / fill_price
-        if potential_loss_pct > BAIL_LOSS_THRESHOLD:
-            return True, f"LOSS_EXCEEDED_{int(BAIL_LOSS_THRESHOLD*100)}PCT"
+    # If we bought at 40c and now ask is 50c, we'd have to pay 10c more = 25% loss
+    # (loss/fill > threshold, multiplied through by fill_price > 0)
+    if fill_price > 0 and current_ask - fill_price > BAIL_LOSS_THRESHOLD * fill_price:
+        return True, _BAIL_LOSS_REASON
 
     return False, None
 
+_BAIL_BANNER = "🚨" * 25
+
 def execute_bail(side, shares, token, books):
     """Cancel orders and sell at market - Emergency Exit"""
     global window_state, session_counters
 
-    print()
-    print("🚨" * 25)
-    print(f"🚨 BAIL MODE TRIGGERED")
-    print(f"🚨 Selling {shares} {side} shares at market")
-    print("🚨" * 25)
+    print("\n".join(("", _BAIL_BANNER, "🚨 BAIL MODE TRIGGERED",
+                     f"🚨 Selling {shares} {side} shares at market", _BAIL_BANNER)))
 
-    # Cancel all pending orders first
-    cancel_all_orders()
+    # Cancel all pending orders first - the exit sell is signed while the cancel is in flight
+    cancel_future = _ORDER_POOL.submit(cancel_all_orders)
 
     # Get best bid for immediate exit
-    if side == "UP":
-        bids = books.get('up_bids', [])
-    else:
-        bids = books.get('down_bids', [])
+    best_bid = book_top(books)[SIDE_KEYS[side]['top_bid']]
 
-    if not bids:
+    if not best_bid:
+        cancel_future.result()
         print(f"[{ts()}] BAIL_FAILED: No bids available for {side}")
         return False
 
-    best_bid = float(bids[0]['price'])
     print(f"[{ts()}] BAIL_SELL: {shares} {side} @ {best_bid*100:.0f}c")
 
+    signed_order = sign_limit_order(token, best_bid, shares, "SELL")
+    cancel_future.result()
+
     # Place market sell order
-    success, order_id = place_limit_order(token, best_bid, shares, "SELL")
+    success, order_id = place_limit_order(token, best_bid, shares, "SELL", signed_order=signed_order)
 
     if success:
-        time.sleep(1.0)
-        status = get_order_status(order_id)
+        status = wait_for_order_status(order_id, 1.0, until_done=True)
         filled = status.get('filled', 0)
         print(f"[{ts()}] BAIL_RESULT: Sold {filled}/{shares} shares")
 
@@ -2414,6 +2953,9 @@ def execute_bail(side, shares, token, books):
     return False
 
 
+# Divider rows of the early-exit banner, keyed by emoji (price stop / OB exit)
+_EARLY_EXIT_RULES = {e: e * 20 for e in ("🛑", "🚨")}
+
 def execute_99c_early_exit(side: str, trigger_value: float, books: dict, reason: str = "ob_reversal") -> bool:
     """Exit 99c position early due to OB reversal.
 
@@ -2447,19 +2989,18 @@ def execute_99c_early_exit(side: str, trigger_value: float, books: dict, reason:
             hs_success, hs_pnl = execute_hard_stop(side, books)
             return hs_success
 
-    shares = window_state.get(f'capture_99c_filled_{side.lower()}', 0)
+    keys = SIDE_KEYS[side]
+    shares = window_state.get(keys['filled'], 0)
     if shares <= 0:
         print(f"[{ts()}] EARLY_EXIT: No shares to sell for {side}")
         return False
 
     # Get best bid, but enforce minimum exit price
-    bids = books.get(f'{side.lower()}_bids', [])
-    if not bids:
+    best_bid = book_top(books)[keys['top_bid']]
+    if not best_bid:
         print(f"[{ts()}] ABORT_EXIT: No bids available for {side}")
         return False
 
-    best_bid = float(bids[0]['price'])
-
     # Use hard stop floor instead of legacy floor
     effective_floor = HARD_STOP_FLOOR if HARD_STOP_ENABLED else PRICE_STOP_FLOOR
     if best_bid < effective_floor:
@@ -2467,21 +3008,20 @@ def execute_99c_early_exit(side: str, trigger_value: float, books: dict, reason:
         return False
 
     exit_price = best_bid
-    token = window_state.get(f'{side.lower()}_token')
+    token = window_state.get(keys['token'])
 
     # Different emoji for price stop vs OB exit
     emoji = "🛑" if reason == "price_stop" else "🚨"
     label = "PRICE STOP" if reason == "price_stop" else "OB EXIT"
 
-    print()
-    print(f"{emoji}" * 20)
-    print(f"{emoji} 99c {label} TRIGGERED")
-    print(f"{emoji} Selling {shares:.0f} {side} shares @ {exit_price*100:.0f}c")
     if reason == "price_stop":
-        print(f"{emoji} Price dropped to: {trigger_value*100:.0f}c")
+        trigger_line = f"{emoji} Price dropped to: {trigger_value*100:.0f}c"
     else:
-        print(f"{emoji} OB Reading: {trigger_value:+.2f}")
-    print(f"{emoji}" * 20)
+        trigger_line = f"{emoji} OB Reading: {trigger_value:+.2f}"
+    rule = _EARLY_EXIT_RULES[emoji]
+    print("\n".join(("", rule, f"{emoji} 99c {label} TRIGGERED",
+                     f"{emoji} Selling {shares:.0f} {side} shares @ {exit_price*100:.0f}c",
+                     trigger_line, rule)))
 
     # Place sell order
     success, order_id = place_limit_order(token, exit_price, shares, "SELL")
@@ -2491,8 +3031,7 @@ def execute_99c_early_exit(side: str, trigger_value: float, books: dict, reason:
         return False
 
     # CRITICAL: Wait for order confirmation
-    time.sleep(1.0)
-    status = get_order_status(order_id)
+    status = wait_for_order_status(order_id, 1.0, until_done=True)
     filled = status.get('filled', 0)
 
     if filled < shares * 0.9:  # Require at least 90% filled
@@ -2541,7 +3080,7 @@ P&L: ${pnl:.2f}
     # Update state
     window_state['capture_99c_exited'] = True
     window_state['capture_99c_exit_reason'] = reason
-    window_state[f'capture_99c_filled_{side.lower()}'] = 0
+    window_state[keys['filled']] = 0
 
     return True
 
@@ -2553,22 +3092,16 @@ def bail_vs_hedge_decision(filled_side, filled_price, filled_shares, books):
 
     Returns: ("HEDGE", price) or ("BAIL", price) or ("WAIT", None)
     """
-    other_side = "DOWN" if filled_side == "UP" else "UP"
+    other_side = SIDE_KEYS[filled_side]['opp']
 
     # Get current market prices
-    if filled_side == "UP":
-        hedge_asks = books.get('down_asks', [])
-        bail_bids = books.get('up_bids', [])
-    else:
-        hedge_asks = books.get('up_asks', [])
-        bail_bids = books.get('down_bids', [])
+    keys = SIDE_KEYS[filled_side]
+    top = book_top(books)
+    hedge_ask, bail_bid = top[keys['opp_top_ask']], top[keys['top_bid']]
 
-    if not hedge_asks or not bail_bids:
+    if not hedge_ask or not bail_bid:
         return ("WAIT", None)
 
-    hedge_ask = float(hedge_asks[0]['price'])
-    bail_bid = float(bail_bids[0]['price'])
-
     # Calculate losses
     # Target hedge price = 0.99 - filled_price (break-even for arb)
     target_hedge = 0.99 - filled_price
@@ -2609,12 +3142,9 @@ def calculate_99c_confidence(ask_price, time_remaining):
     """
     base_confidence = ask_price
 
-    # Get time penalty (default to highest for safety)
-    time_penalty = 0.15
-    for max_time, penalty in CAPTURE_99C_TIME_PENALTIES:
-        if time_remaining <= max_time:
-            time_penalty = penalty
-            break
+    # Get time penalty from the first bracket covering time_remaining (default to highest for safety)
+    idx = bisect_left(_PENALTY_MAX_TIMES, time_remaining)
+    time_penalty = _PENALTY_VALUES[idx] if idx < len(_PENALTY_VALUES) else 0.15
 
     confidence = base_confidence - time_penalty
     return confidence, time_penalty
@@ -2639,44 +3169,35 @@ def check_99c_entry_filter(side: str) -> tuple[bool, str]:
     if len(market_price_history) < 10:
         return True, "insufficient_history"
 
-    # Extract price lists
+    # (time, up_ask, down_ask) tuples: pick our/opposing ask columns
+    our_col, opp_col = (1, 2) if side == "UP" else (2, 1)
     history = list(market_price_history)
-    if side == "UP":
-        our_prices = [h[1] for h in history]  # up_ask
-        opp_prices = [h[2] for h in history]  # down_ask
-    else:
-        our_prices = [h[2] for h in history]  # down_ask
-        opp_prices = [h[1] for h in history]  # up_ask
+
+    # Only the last 10 ticks of our side are ever inspected
+    our_prices = list(map(itemgetter(our_col), history[-max(10, ENTRY_FILTER_STABLE_TICKS):]))
 
     # FILTER 1: Stability check - last N ticks all >= 97c
     stable_prices = our_prices[-ENTRY_FILTER_STABLE_TICKS:]
-    is_stable = all(p >= ENTRY_FILTER_STABLE_THRESHOLD for p in stable_prices)
+    # Entry is safe if: (stable at 97c+) OR (low volatility AND opposing low)
+    # This matches the pattern from our analysis - stable wins outright, so the
+    # other two filters are only evaluated when it fails
+    if min(stable_prices) >= ENTRY_FILTER_STABLE_THRESHOLD:
+        return True, "stable_at_97c"
 
     # FILTER 2: Low volatility - max jump in past 10 ticks
     recent_prices = our_prices[-10:]
-    max_jump = 0
-    for i in range(1, len(recent_prices)):
-        jump = abs(recent_prices[i] - recent_prices[i-1])
-        if jump > max_jump:
-            max_jump = jump
+    max_jump = max(map(abs, map(sub, recent_prices[1:], recent_prices[:-1])), default=0)
     is_low_volatility = max_jump <= ENTRY_FILTER_MAX_JUMP
 
     # FILTER 3: Opposing side was low recently
-    max_opp_recent = max(opp_prices) if opp_prices else 0
+    max_opp_recent = max(map(itemgetter(opp_col), history), default=0)
     is_opp_low = max_opp_recent <= ENTRY_FILTER_MAX_OPP_RECENT
 
-    # Entry is safe if: (stable at 97c+) OR (low volatility AND opposing low)
-    # This matches the pattern from our analysis
-    if is_stable:
-        return True, "stable_at_97c"
-
     if is_low_volatility and is_opp_low:
         return True, "low_volatility"
 
-    # Build rejection reason
-    reasons = []
-    if not is_stable:
-        reasons.append(f"unstable({stable_prices[-1]*100:.0f}c)")
+    # Build rejection reason (always unstable by this point)
+    reasons = [f"unstable({stable_prices[-1]*100:.0f}c)"]
     if not is_low_volatility:
         reasons.append(f"volatile(jump={max_jump*100:.0f}c)")
     if not is_opp_low:
@@ -2725,35 +3246,33 @@ def check_99c_capture_opportunity(ask_up, ask_down, ttc):
     if ttc < CAPTURE_99C_MIN_TIME:
         return None
 
-    # Check UP side
-    conf_up, penalty_up = calculate_99c_confidence(ask_up, ttc)
-    if conf_up >= CAPTURE_99C_MIN_CONFIDENCE:
-        # Don't enter if ask is too high - filling at 99c would mean catching a reversal
-        if ask_up >= CAPTURE_99C_MAX_ASK:
-            return None
-        # v1.24: Apply entry filter to avoid volatile/spiking entries
-        safe, filter_reason = check_99c_entry_filter("UP")
-        if not safe:
-            print(f"[{ts()}] 99c ENTRY FILTER: Skipping UP (conf={conf_up*100:.0f}%) - {filter_reason}")
-            return None
-        return {'side': 'UP', 'ask': ask_up, 'confidence': conf_up, 'penalty': penalty_up, 'filter_reason': filter_reason}
+    # Time penalty depends only on ttc - one bracket lookup serves both sides
+    conf_up, penalty = calculate_99c_confidence(ask_up, ttc)
+    conf_down = ask_down - penalty
 
-    # Check DOWN side
-    conf_down, penalty_down = calculate_99c_confidence(ask_down, ttc)
-    if conf_down >= CAPTURE_99C_MIN_CONFIDENCE:
+    # UP is checked first; the first side over the confidence bar decides the tick
+    for side, ask, conf in (("UP", ask_up, conf_up), ("DOWN", ask_down, conf_down)):
+        if conf < CAPTURE_99C_MIN_CONFIDENCE:
+            continue
         # Don't enter if ask is too high - filling at 99c would mean catching a reversal
-        if ask_down >= CAPTURE_99C_MAX_ASK:
+        if ask >= CAPTURE_99C_MAX_ASK:
             return None
         # v1.24: Apply entry filter to avoid volatile/spiking entries
-        safe, filter_reason = check_99c_entry_filter("DOWN")
+        safe, filter_reason = check_99c_entry_filter(side)
         if not safe:
-            print(f"[{ts()}] 99c ENTRY FILTER: Skipping DOWN (conf={conf_down*100:.0f}%) - {filter_reason}")
+            print(f"[{ts()}] 99c ENTRY FILTER: Skipping {side} (conf={conf*100:.0f}%) - {filter_reason}")
             return None
-        return {'side': 'DOWN', 'ask': ask_down, 'confidence': conf_down, 'penalty': penalty_down, 'filter_reason': filter_reason}
+        return {'side': side, 'ask': ask, 'confidence': conf, 'penalty': penalty, 'filter_reason': filter_reason}
 
     return None
 
 
+# Fixed rows of the 99c capture / hedge console boxes
+_CAPTURE_BOX_TOP = "┌" + "─" * 15 + " 99c CAPTURE " + "─" * 15 + "┐"
+_CAPTURE_BOX_BOTTOM = "└" + "─" * 44 + "┘"
+_HEDGE_BOX_TOP = "┌" + "─" * 15 + " 99c HEDGE TRIGGERED " + "─" * 15 + "┐"
+_HEDGE_BOX_BOTTOM = "└" + "─" * 51 + "┘"
+
 def execute_99c_capture(side, current_ask, confidence, penalty, ttc):
     """
     Place a $5 order at 99c for the likely winner.
@@ -2771,14 +3290,16 @@ def execute_99c_capture(side, current_ask, confidence, penalty, ttc):
         shares = math.ceil(trade_budget / CAPTURE_99C_BID_PRICE)
     else:
         shares = int(CAPTURE_99C_MAX_SPEND / CAPTURE_99C_BID_PRICE)
-    token = window_state['up_token'] if side == 'UP' else window_state['down_token']
+    token = window_state[SIDE_KEYS[side]['token']]
 
-    print()
-    print(f"┌─────────────── 99c CAPTURE ───────────────┐")
-    print(f"│  {side} @ {current_ask*100:.0f}c | T-{ttc:.0f}s | Confidence: {confidence*100:.0f}%".ljust(44) + "│")
-    print(f"│  (base {current_ask*100:.0f}% - {penalty*100:.0f}% time penalty)".ljust(44) + "│")
-    print(f"│  Bidding {shares} shares @ {CAPTURE_99C_BID_PRICE*100:.0f}c = ${shares * CAPTURE_99C_BID_PRICE:.2f}".ljust(44) + "│")
-    print(f"└────────────────────────────────────────────┘")
+    print("\n".join((
+        "",
+        _CAPTURE_BOX_TOP,
+        f"│  {f'{side} @ {current_ask*100:.0f}c | T-{ttc:.0f}s | Confidence: {confidence*100:.0f}%':<41}│",
+        f"│  {f'(base {current_ask*100:.0f}% - {penalty*100:.0f}% time penalty)':<41}│",
+        f"│  {f'Bidding {shares} shares @ {CAPTURE_99C_BID_PRICE*100:.0f}c = ${shares * CAPTURE_99C_BID_PRICE:.2f}':<41}│",
+        _CAPTURE_BOX_BOTTOM,
+    )))
 
     # Bypass price failsafe - 99c capture is intentionally above 85c limit
     success, order_id, status = place_and_verify_order(
@@ -2823,80 +3344,73 @@ def check_99c_capture_hedge(books, ttc):
     if not bet_side:
         return
 
-    # Get current ask for our bet side
-    if bet_side == "UP":
-        current_ask = float(books['up_asks'][0]['price']) if books.get('up_asks') else 0
-        opposite_asks = books.get('down_asks', [])
-        opposite_token = window_state['down_token']
-        opposite_side = "DOWN"
-    else:
-        current_ask = float(books['down_asks'][0]['price']) if books.get('down_asks') else 0
-        opposite_asks = books.get('up_asks', [])
-        opposite_token = window_state['up_token']
-        opposite_side = "UP"
-
-    if not opposite_asks:
-        return
-
-    # Get danger score from window_state (calculated by main loop)
+    # Danger score is calculated by the main loop - on calm ticks this is the only check
     danger_score = window_state.get('danger_score', 0)
+    if danger_score < DANGER_THRESHOLD:
+        return
 
-    # Check if we should hedge based on danger score
-    if danger_score >= DANGER_THRESHOLD:
-        opposite_ask = float(opposite_asks[0]['price'])
-        shares = window_state.get('capture_99c_shares', 0)
-
-        if shares > 0 and opposite_ask < 0.50:  # Don't hedge if opposite too expensive
-            print()
-            print(f"┌─────────────── 99c HEDGE TRIGGERED ───────────────┐")
-            print(f"│  Danger score: {danger_score:.2f} >= {DANGER_THRESHOLD:.2f} threshold".ljust(50) + "│")
-            print(f"│  Bet: {bet_side} @ 99c".ljust(50) + "│")
-            print(f"│  Hedging: {shares} {opposite_side} @ {opposite_ask*100:.0f}c".ljust(50) + "│")
-            print(f"└───────────────────────────────────────────────────┘")
-
-            # Place hedge order at market (take the ask)
-            success, order_id, status = place_and_verify_order(opposite_token, opposite_ask, shares)
-            if success:
-                combined = 0.99 + opposite_ask
-                loss_per_share = combined - 1.00
-                total_loss = loss_per_share * shares
-
-                window_state['capture_99c_hedged'] = True
-                window_state['capture_99c_hedge_price'] = opposite_ask
+    # Get current ask for our bet side
+    keys = SIDE_KEYS[bet_side]
+    top = book_top(books)
+    current_ask = top[keys['top_ask']]
+    opposite_ask = top[keys['opp_top_ask']]
+    opposite_token = window_state[keys['opp_token']]
+    opposite_side = keys['opp']
+
+    if not opposite_ask:
+        return
 
-                # Track hedge shares in filled counts
-                if opposite_side == "UP":
-                    window_state['filled_up_shares'] = max(window_state.get('filled_up_shares', 0), shares)
-                    window_state['capture_99c_filled_up'] = max(window_state.get('capture_99c_filled_up', 0), shares)
-                else:
-                    window_state['filled_down_shares'] = max(window_state.get('filled_down_shares', 0), shares)
-                    window_state['capture_99c_filled_down'] = max(window_state.get('capture_99c_filled_down', 0), shares)
-
-                print(f"│  ✅ HEDGED: Combined {combined*100:.0f}c | Loss: ${abs(total_loss):.2f}".ljust(50) + "│")
-                print(f"└───────────────────────────────────────────────────┘")
-                print()
-
-                # LOG-02: Log hedge event with full signal breakdown
-                danger_result = window_state.get('danger_result', {})
-                log_event("99C_HEDGE", window_state.get('window_id', ''),
-                               bet_side=bet_side, hedge_side=opposite_side,
-                               hedge_price=opposite_ask, combined=combined,
-                               pnl=-abs(total_loss),  # Record loss in PnL column
-                               danger_score=danger_score,
-                               conf_drop=danger_result.get('confidence_drop', 0),
-                               conf_wgt=danger_result.get('confidence_component', 0),
-                               imb_raw=danger_result.get('imbalance', 0),
-                               imb_wgt=danger_result.get('imbalance_component', 0),
-                               vel_raw=danger_result.get('velocity', 0),
-                               vel_wgt=danger_result.get('velocity_component', 0),
-                               opp_raw=danger_result.get('opponent_ask', 0),
-                               opp_wgt=danger_result.get('opponent_component', 0),
-                               time_raw=danger_result.get('time_remaining', 0),
-                               time_wgt=danger_result.get('time_component', 0))
+    shares = window_state.get('capture_99c_shares', 0)
+
+    if shares > 0 and opposite_ask < 0.50:  # Don't hedge if opposite too expensive
+        print("\n".join((
+            "",
+            _HEDGE_BOX_TOP,
+            f"│  {f'Danger score: {danger_score:.2f} >= {DANGER_THRESHOLD:.2f} threshold':<47}│",
+            f"│  {f'Bet: {bet_side} @ 99c':<47}│",
+            f"│  {f'Hedging: {shares} {opposite_side} @ {opposite_ask*100:.0f}c':<47}│",
+            _HEDGE_BOX_BOTTOM,
+        )))
+
+        # Place hedge order at market (take the ask)
+        success, order_id, status = place_and_verify_order(opposite_token, opposite_ask, shares)
+        if success:
+            combined = 0.99 + opposite_ask
+            loss_per_share = combined - 1.00
+            total_loss = loss_per_share * shares
+
+            window_state['capture_99c_hedged'] = True
+            window_state['capture_99c_hedge_price'] = opposite_ask
+
+            # Track hedge shares in filled counts
+            if opposite_side == "UP":
+                window_state['filled_up_shares'] = max(window_state.get('filled_up_shares', 0), shares)
+                window_state['capture_99c_filled_up'] = max(window_state.get('capture_99c_filled_up', 0), shares)
             else:
-                print(f"│  ❌ HEDGE FAILED: {status}".ljust(50) + "│")
-                print(f"└───────────────────────────────────────────────────┘")
-                print()
+                window_state['filled_down_shares'] = max(window_state.get('filled_down_shares', 0), shares)
+                window_state['capture_99c_filled_down'] = max(window_state.get('capture_99c_filled_down', 0), shares)
+
+            print(f"│  {f'✅ HEDGED: Combined {combined*100:.0f}c | Loss: ${abs(total_loss):.2f}':<47}│\n{_HEDGE_BOX_BOTTOM}\n")
+
+            # LOG-02: Log hedge event with full signal breakdown
+            danger_result = window_state.get('danger_result', {})
+            log_event("99C_HEDGE", window_state.get('window_id', ''),
+                           bet_side=bet_side, hedge_side=opposite_side,
+                           hedge_price=opposite_ask, combined=combined,
+                           pnl=-abs(total_loss),  # Record loss in PnL column
+                           danger_score=danger_score,
+                           conf_drop=danger_result.get('confidence_drop', 0),
+                           conf_wgt=danger_result.get('confidence_component', 0),
+                           imb_raw=danger_result.get('imbalance', 0),
+                           imb_wgt=danger_result.get('imbalance_component', 0),
+                           vel_raw=danger_result.get('velocity', 0),
+                           vel_wgt=danger_result.get('velocity_component', 0),
+                           opp_raw=danger_result.get('opponent_ask', 0),
+                           opp_wgt=danger_result.get('opponent_component', 0),
+                           time_raw=danger_result.get('time_remaining', 0),
+                           time_wgt=danger_result.get('time_component', 0))
+        else:
+            print(f"│  {f'❌ HEDGE FAILED: {status}':<47}│\n{_HEDGE_BOX_BOTTOM}\n")
 
 
 def get_price_velocity(btc_price_history: deque, bet_side: str) -> float:
@@ -2910,21 +3424,16 @@ def get_price_velocity(btc_price_history: deque, bet_side: str) -> float:
     if len(btc_price_history) < 2:
         return 0.0
 
-    oldest_ts, oldest_price = btc_price_history[0]
-    newest_ts, newest_price = btc_price_history[-1]
-
+    # Only the two ends matter - both are O(1) deque reads, timestamps unused
+    oldest_price = btc_price_history[0][1]
     if oldest_price == 0:
         return 0.0
 
     # Fractional change: (new - old) / old
-    price_change = (newest_price - oldest_price) / oldest_price
-
     # For UP: falling price is bad, so negate (falling = negative change -> positive danger)
     # For DOWN: rising price is bad, so keep as-is (rising = positive change -> positive danger)
-    if bet_side == "UP":
-        return -price_change
-    else:
-        return price_change
+    price_change = (btc_price_history[-1][1] - oldest_price) / oldest_price
+    return -price_change if bet_side == "UP" else price_change
 
 
 def calculate_danger_score(
@@ -2993,6 +3502,11 @@ def calculate_danger_score(
 # ARB QUOTING WITH SMART SIGNALS
 # ============================================================================
 
+# Analyzer strength ranks (None = no signal) and the configured minimum, resolved once
+_OB_STRENGTH_LEVELS = {"WEAK": 1, "MODERATE": 2, "STRONG": 3, None: 0}
+_OB_MIN_STRENGTH = _OB_STRENGTH_LEVELS.get(ORDERBOOK_MIN_SIGNAL_STRENGTH, 2)
+_ARB_BANNER = "📝" * 25
+
 def check_and_place_arb(books, ttc):
     """
     Check for arb opportunity and place orders.
@@ -3009,8 +3523,11 @@ def check_and_place_arb(books, ttc):
         _last_skip_reason = f"late entry ({ttc:.0f}s<{MIN_TIME_FOR_ENTRY}s)"
         return False
 
-    # Position verification using improved function
-    api_position = get_verified_position()
+    # Position verification using improved function (deduped within a tick). While
+    # flat locally, a read up to POSITION_CACHE_MAX_AGE old still catches drift
+    # without a REST call on every pre-arb tick.
+    flat = not window_state['filled_up_shares'] and not window_state['filled_down_shares']
+    api_position = get_verified_position(POSITION_CACHE_MAX_AGE if flat else POSITION_DEDUPE_AGE)
     if api_position:
         api_up, api_down = api_position
         local_up = window_state['filled_up_shares']
@@ -3040,29 +3557,23 @@ def check_and_place_arb(books, ttc):
     if ttc <= PAIR_DEADLINE_SECONDS:
         return False
 
-    up_asks = books['up_asks']
-    down_asks = books['down_asks']
-
-    if not up_asks or not down_asks:
-        return False
-
-    ask_up = float(up_asks[0]['price'])
-    ask_down = float(down_asks[0]['price'])
-
-    # Skip pinned
-    if ask_up <= PINNED_ASK_LIMIT or ask_down <= PINNED_ASK_LIMIT:
-        return False
+    top = book_top(books)  # 0.0 = empty side
+    ask_up = top.up_ask
+    ask_down = top.down_ask
 
     # ===========================================
     # STRONG DIVERGENCE CHECK
     # Requires: cheap side <= 42c AND expensive side >= 58c
     # ===========================================
-    cheap_price = min(ask_up, ask_down)
-    expensive_price = max(ask_up, ask_down)
+    if ask_up <= ask_down:
+        cheap_price, expensive_price = ask_up, ask_down
+    else:
+        cheap_price, expensive_price = ask_down, ask_up
 
-    # Check 1: Cheap side must be cheap enough
-    if cheap_price > DIVERGENCE_THRESHOLD:
-        return False  # Both sides near 50/50
+    # Skip empty/pinned (either side pinned <=> cheap side pinned), then
+    # Check 1: Cheap side must be cheap enough - else both sides near 50/50
+    if cheap_price <= PINNED_ASK_LIMIT or cheap_price > DIVERGENCE_THRESHOLD:
+        return False
 
     # Check 2: Expensive side must show clear momentum (NEW)
     if expensive_price < MIN_EXPENSIVE_SIDE_PRICE:
@@ -3079,7 +3590,7 @@ def check_and_place_arb(books, ttc):
 
     if USE_SMART_SIGNALS and STRATEGY_SIGNALS_AVAILABLE:
         # Update BTC price
-        btc_price = get_btc_price_from_coinbase()
+        btc_price = get_live_btc_price()
         if btc_price:
             update_btc_price(btc_price)
 
@@ -3140,10 +3651,7 @@ def check_and_place_arb(books, ttc):
     # ORDER BOOK IMBALANCE CHECK
     # ===========================================
     if USE_ORDERBOOK_SIGNALS and ORDERBOOK_ANALYZER_AVAILABLE and orderbook_analyzer:
-        ob_result = orderbook_analyzer.analyze(
-            books.get('up_bids', []), books.get('up_asks', []),
-            books.get('down_bids', []), books.get('down_asks', [])
-        )
+        ob_result = orderbook_analyzer.analyze_books(books)
 
         signal_side = ob_result.get('signal')  # BUY_UP, BUY_DOWN, or None
         strength = ob_result.get('strength')   # STRONG, MODERATE, WEAK, or None
@@ -3167,13 +3675,11 @@ def check_and_place_arb(books, ttc):
                 #     return False
 
         # Check minimum strength requirement
-        strength_levels = {"WEAK": 1, "MODERATE": 2, "STRONG": 3}
-        min_strength = strength_levels.get(ORDERBOOK_MIN_SIGNAL_STRENGTH, 2)
-        current_strength = strength_levels.get(strength, 0)
+        current_strength = _OB_STRENGTH_LEVELS.get(strength, 0)
 
         if ORDERBOOK_REQUIRE_TREND and trend is None:
             print(f"[{ts()}] ⚠️  NO TREND CONFIRMED (need {orderbook_analyzer.history_size // 6}+ consistent readings)")
-        elif strength and current_strength >= min_strength:
+        elif current_strength >= _OB_MIN_STRENGTH:
             print(f"[{ts()}] ✅ ORDERBOOK STRENGTH OK: {strength} >= {ORDERBOOK_MIN_SIGNAL_STRENGTH}")
 
     # Compute bids
@@ -3197,14 +3703,13 @@ def check_and_place_arb(books, ttc):
     base_q = calc_q(bid_up, bid_down)
     q = max(MIN_SHARES, min(FAILSAFE_MAX_SHARES, int(base_q * size_multiplier)))
 
-    print()
-    print("📝" * 25)
-    print(f"📝 ARB OPPORTUNITY FOUND")
-    print(f"📝 UP @ {bid_up*100:.0f}c + DOWN @ {bid_down*100:.0f}c = {total*100:.0f}c")
-    print(f"📝 Locked Profit: {locked_profit*100:.0f}c per share | Shares: {q}")
+    banner = ["", _ARB_BANNER, "📝 ARB OPPORTUNITY FOUND",
+              f"📝 UP @ {bid_up*100:.0f}c + DOWN @ {bid_down*100:.0f}c = {total*100:.0f}c",
+              f"📝 Locked Profit: {locked_profit*100:.0f}c per share | Shares: {q}"]
     if size_multiplier != 1.0:
-        print(f"📝 (Size adjusted from {base_q} by {size_multiplier:.2f}x)")
-    print("📝" * 25)
+        banner.append(f"📝 (Size adjusted from {base_q} by {size_multiplier:.2f}x)")
+    banner.append(_ARB_BANNER)
+    print("\n".join(banner))
 
     # MOMENTUM-FIRST STRATEGY
     if MOMENTUM_FIRST_ENABLED:
@@ -3232,9 +3737,17 @@ def check_and_place_arb(books, ttc):
         print(f"⏳ Waiting for {first_side} to fill...")
         first_filled = False
         first_fill_shares = 0
-        for i in range(25):
-            time.sleep(0.2)
-            status = get_order_status(order_first)
+        # Same 5s budget as before. With the user feed connected the wait wakes on the
+        # fill event itself, so REST is only a slow backstop instead of the clock.
+        fill_deadline = time.time() + 5.0
+        poll_interval = 1.0 if USER_FEED_AVAILABLE and user_feed.is_connected() else 0.2
+        progress_every = round(1.0 / poll_interval)  # Progress line about once a second
+        polls = 0
+        while time.time() < fill_deadline:
+            wait_for_order_fills([order_first], poll_interval)
+            status = feed_order_status(order_first)
+            if status is None or status['filled'] < q * 0.9:
+                status = get_order_status(order_first)
             if status['filled'] >= q * 0.9:
                 first_filled = True
                 first_fill_shares = status['filled']
@@ -3242,7 +3755,10 @@ def check_and_place_arb(books, ttc):
                 log_event("ARB_FILL", window_state.get('window_id', ''), side=first_side, shares=first_fill_shares, price=first_bid)
                 window_state['arb_placed_this_window'] = True  # Prevent duplicate arb attempts after first fill
                 break
-            if i % 5 == 4:
+            if status['status'] == 'CANCELED':
+                break  # Nothing more can fill - don't spin on REST until the deadline
+            polls += 1
+            if polls % progress_every == 0:
                 print(f"⏳ {first_side}: {status['filled']}/{q} filled...")
 
         if not first_filled:
@@ -3293,12 +3809,12 @@ def check_and_place_arb(books, ttc):
             order_down = order_first if first_side == "DOWN" else order_second
 
     else:
-        # Simultaneous placement
-        with ThreadPoolExecutor(max_workers=2) as ex:
-            up_future = ex.submit(place_limit_order, books['up_token'], bid_up, q)
-            down_future = ex.submit(place_limit_order, books['down_token'], bid_down, q)
-            success_up, order_up = up_future.result(timeout=3)
-            success_down, order_down = down_future.result(timeout=3)
+        # Simultaneous placement on the shared order pool (threads and keep-alive
+        # connections already warm - no per-call executor spin-up)
+        up_future = _ORDER_POOL.submit(place_limit_order, books['up_token'], bid_up, q)
+        down_future = _ORDER_POOL.submit(place_limit_order, books['down_token'], bid_down, q)
+        success_up, order_up = up_future.result(timeout=3)
+        success_down, order_down = down_future.result(timeout=3)
 
         if success_up:
             window_state['open_up_order_ids'].append(order_up)
@@ -3353,18 +3869,32 @@ def check_and_place_arb(books, ttc):
 # MONITOR ARB ORDERS (simplified - keeping core logic)
 # ============================================================================
 
+ARB_REST_BACKSTOP_SECONDS = 2.0  # With the user feed live, arb fills are re-read over REST this often
+_arb_rest_check_time = 0.0
+
 def monitor_arb_orders(books):
     """Monitor pending arb orders for fills"""
-    global window_state
+    global window_state, _arb_rest_check_time
 
     if not window_state['current_arb_orders']:
         return
 
     arb = window_state['current_arb_orders']
-    elapsed_ms = (time.time() - window_state['arb_order_time']) * 1000
-
-    up_status = get_order_status(arb['up_id'])
-    down_status = get_order_status(arb['down_id'])
+    now = time.time()
+    elapsed_ms = (now - window_state['arb_order_time']) * 1000
+
+    # Fills come from the user feed; REST only when it's down, hasn't seen an
+    # order yet, or the periodic backstop is due (covers events lost to a reconnect)
+    up_status = down_status = None
+    if (USER_FEED_AVAILABLE and user_feed.is_connected()
+            and now - _arb_rest_check_time < ARB_REST_BACKSTOP_SECONDS):
+        up_status = feed_order_status(arb['up_id'])
+        down_status = feed_order_status(arb['down_id'])
+    if up_status is None or down_status is None:
+        up_future, down_future = check_both_orders_async(arb['up_id'], arb['down_id'])
+        up_status = _future_result(up_future, dict(_ORDER_STATUS_ERROR))
+        down_status = _future_result(down_future, dict(_ORDER_STATUS_ERROR))
+        _arb_rest_check_time = now
 
     up_filled = up_status['filled']
     down_filled = down_status['filled']
@@ -3413,6 +3943,8 @@ def run_pairing_mode(books, ttc):
     """Execute forced completion to fix imbalance"""
     global window_state
 
+    now = time.time()  # One clock reading per pass (refreshed after the cancel settle)
+
     # ===========================================
     # BAIL MODE TRIGGER - 90 SECONDS (NO EXCEPTIONS)
     # ===========================================
@@ -3420,8 +3952,8 @@ def run_pairing_mode(books, ttc):
         imb = get_arb_imbalance()  # Exclude 99c capture shares
         if imb != 0:
             # Check bail conditions
-            first_order_time = window_state.get('first_order_time', time.time())
-            seconds_since_fill = time.time() - first_order_time
+            first_order_time = window_state.get('first_order_time', now)
+            seconds_since_fill = now - first_order_time
             fill_price = window_state.get('avg_up_price_paid', 0) if imb > 0 else window_state.get('avg_down_price_paid', 0)
 
             # Get current ask for the missing side
@@ -3441,7 +3973,7 @@ def run_pairing_mode(books, ttc):
             window_state['state'] = STATE_DONE
             return
 
-    time_since_last = time.time() - window_state.get('last_order_time', 0)
+    time_since_last = now - window_state.get('last_order_time', 0)
     if time_since_last < ORDER_COOLDOWN_SECONDS:
         return
 
@@ -3483,7 +4015,7 @@ def run_pairing_mode(books, ttc):
             'down_ask': float(books['down_asks'][0]['price']) if books.get('down_asks') else 0.50,
             'up_bid': float(books['up_bids'][0]['price']) if books.get('up_bids') else 0.50,
             'down_bid': float(books['down_bids'][0]['price']) if books.get('down_bids') else 0.50,
-            'time': time.time()
+            'time': now
         }
         print(f"[{ts()}] PAIRING_ENTRY_MARKET: UP ask={window_state['pairing_entry_market']['up_ask']*100:.0f}c | "
               f"DOWN ask={window_state['pairing_entry_market']['down_ask']*100:.0f}c")
@@ -3511,6 +4043,7 @@ def run_pairing_mode(books, ttc):
     # The original order may have filled between our imbalance check and cancel
     time.sleep(1.0)  # Brief settle time for cancel/fills to propagate
     verified_up, verified_down = get_verified_fills()
+    now = time.time()  # The settle + verify above took a second or more
     window_state['filled_up_shares'] = verified_up
     window_state['filled_down_shares'] = verified_down
 
@@ -3533,7 +4066,7 @@ def run_pairing_mode(books, ttc):
     # EARLY BAIL LOGIC v1.10 - 5-SECOND RULE
     # ===========================================
     if window_state.get('pairing_start_time'):
-        time_in_pairing = time.time() - window_state['pairing_start_time']
+        time_in_pairing = now - window_state['pairing_start_time']
         profit_target_price = 0.99 - existing_price
         current_distance = (best_ask - profit_target_price) * 100  # In cents
         best_ever = window_state.get('best_distance_seen', float('inf'))
@@ -3574,7 +4107,7 @@ def run_pairing_mode(books, ttc):
         # --- MARKET REVERSAL DETECTION (within 5-second window) ---
         # Can trigger early bail BEFORE the 5-second rule if market moves against us
         entry_market = window_state.get('pairing_entry_market', {})
-        time_since_entry = time.time() - entry_market.get('time', time.time())
+        time_since_entry = now - entry_market.get('time', now)
 
         if time_since_entry <= PAIR_WINDOW_SECONDS and entry_market:
             # Calculate market move against our position
@@ -3606,10 +4139,7 @@ def run_pairing_mode(books, ttc):
             # --- OB-BASED REVERSAL DETECTION (v1.9) ---
             # If OB shows heavy selling on our filled side + small price drop, bail early
             if ORDERBOOK_ANALYZER_AVAILABLE and orderbook_analyzer:
-                ob_result = orderbook_analyzer.analyze(
-                    books.get('up_bids', []), books.get('up_asks', []),
-                    books.get('down_bids', []), books.get('down_asks', [])
-                )
+                ob_result = orderbook_analyzer.analyze_books(books)
                 filled_side_imb = ob_result['up_imbalance'] if filled_side == "UP" else ob_result['down_imbalance']
 
                 # OB shows selling pressure + small price drop = bail immediately
@@ -3632,8 +4162,8 @@ def run_pairing_mode(books, ttc):
         if time_in_pairing >= EARLY_HEDGE_TIMEOUT and time_in_pairing < 120:
             # Check every EARLY_BAIL_CHECK_INTERVAL seconds
             last_check = window_state.get('last_bail_check_time', 0)
-            if time.time() - last_check >= EARLY_BAIL_CHECK_INTERVAL:
-                window_state['last_bail_check_time'] = time.time()
+            if now - last_check >= EARLY_BAIL_CHECK_INTERVAL:
+                window_state['last_bail_check_time'] = now
 
                 decision, price = bail_vs_hedge_decision(filled_side, filled_price, missing_shares, books)
 
@@ -3677,8 +4207,8 @@ def run_pairing_mode(books, ttc):
     # Step 1: Post-only with hedge escalation
     if ttc > TAKER_AT_SECONDS:
         # Calculate hedge price based on escalation schedule
-        first_order_time = window_state.get('first_order_time', time.time())
-        seconds_since_fill = time.time() - first_order_time
+        first_order_time = window_state.get('first_order_time', now)
+        seconds_since_fill = now - first_order_time
         max_hedge, tolerance_cents = calculate_hedge_price(existing_price, seconds_since_fill)
 
         # Calculate profit target for logging
@@ -3807,12 +4337,63 @@ def run_pairing_mode(books, ttc):
 # TRADE LOGGING
 # ============================================================================
 
+TRADES_FILE = "trades_smart.json"
+_trades_dirty = threading.Event()  # Set by save_trades(), cleared by the writer thread
+_trades_write_lock = threading.Lock()  # Writer thread and shutdown flush share the temp file
+_trades_pending = None  # Latest serialized trades_log awaiting a write
+_trades_pending_lock = threading.Lock()
+
 def save_trades():
+    """Snapshot trades_log here (it holds the live window_state); the write happens on the writer thread."""
+    global _trades_pending
     try:
-        with open("trades_smart.json", "w") as f:
-            json.dump(trades_log, f, indent=2, default=str)
+        data = json.dumps(trades_log, indent=2, default=str)
     except Exception as e:
         print(f"[{ts()}] SAVE_TRADES_ERROR: {e}")
+        return
+    with _trades_pending_lock:
+        _trades_pending = data
+    _trades_dirty.set()
+
+def _write_pending_trades():
+    """Write the latest snapshot (atomic replace, so a crash never leaves half a file).
+
+    Returns False if the write failed; the snapshot is kept and re-queued.
+    """
+    global _trades_pending
+    with _trades_write_lock:
+        _trades_dirty.clear()
+        with _trades_pending_lock:
+            data, _trades_pending = _trades_pending, None
+        if data is None:
+            return True
+        try:
+            tmp = TRADES_FILE + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(data)
+            os.replace(tmp, TRADES_FILE)
+            return True
+        except Exception as e:
+            print(f"[{ts()}] SAVE_TRADES_ERROR: {e}")
+            with _trades_pending_lock:
+                if _trades_pending is None:  # Keep a newer snapshot if one arrived meanwhile
+                    _trades_pending = data
+            _trades_dirty.set()
+            return False
+
+def flush_trades():
+    """Snapshot and write trades_log now (shutdown path)."""
+    save_trades()
+    _write_pending_trades()
+
+def _trades_writer():
+    """Background thread: coalesce save_trades() snapshots into one write each."""
+    while True:
+        _trades_dirty.wait()
+        if not _write_pending_trades():
+            time.sleep(1.0)  # Back off before retrying a failed write
+
+threading.Thread(target=_trades_writer, daemon=True, name="trades-writer").start()
 
 # ============================================================================
 # ROI HALT STATE PERSISTENCE (v1.46)
@@ -4050,6 +4631,7 @@ def check_daily_roi():
 def main():
     global window_state, trades_log, error_count, clob_client
     global trading_halted, capital_deployed, cached_portfolio_total, daily_trade_shares
+    global USER_FEED_AVAILABLE
 
     # v1.46: Trading halt state
     trading_halted = load_halt_state()
@@ -4074,6 +4656,13 @@ def main():
         print(f"❌ Failed to initialize: {e}")
         return
 
+    # Keep a fresh position on hand so hard stop / OB exit don't wait on the positions API
+    threading.Thread(target=_position_refresher, daemon=True).start()
+
+    # Fill events for our orders, so exit walks wake on a match instead of the next poll
+    if user_feed:
+        USER_FEED_AVAILABLE = user_feed.start(clob_client.creds)
+
     print("STARTUP SAFETY: Cancelling any open orders...")
     try:
         cancel_all_orders()
@@ -4238,7 +4827,6 @@ def main():
                                 except Exception as e:
                                     print(f"[{ts()}] BG_RESOLVE_ERROR: {e}")
 
-                            import threading
                             threading.Thread(target=_resolve_99c_outcome, daemon=True).start()
                             print(f"[{ts()}] 99c resolution moved to background — main loop continues immediately")
                         else:
@@ -4284,12 +4872,23 @@ def main():
                         else:
                             print(f"[{ts()}] TREND_GUARD: Collecting history ({len(recent_window_btc)}/{TREND_LOOKBACK_WINDOWS + 1} windows)")
 
+                    # Window-open housekeeping is independent network I/O - overlap it
+                    # instead of paying each round-trip back to back
+                    _pending_snapshot = pending_99c_resolutions[:]
+                    with ThreadPoolExecutor(max_workers=4) as _hk_pool:
+                        _outcome_futures = [_hk_pool.submit(check_99c_outcome, p['side'], p['slug'])
+                                            for p in _pending_snapshot]
+                        _gas_future = _hk_pool.submit(check_gas_and_alert)
+                        _daily_future = _hk_pool.submit(check_and_log_balance)
+                        _balance_future = _hk_pool.submit(get_portfolio_balance)
+                        _market_future = _hk_pool.submit(get_market_data, slug)
+
                     # Resolve any pending 99c outcomes from previous windows
-                    if pending_99c_resolutions:
+                    if _pending_snapshot:
                         resolved = []
-                        for pending in pending_99c_resolutions[:]:  # Iterate over copy
+                        for pending, _outcome_future in zip(_pending_snapshot, _outcome_futures):
                             try:
-                                result = check_99c_outcome(pending['side'], pending['slug'])
+                                result = _outcome_future.result()
                                 if result is not None:
                                     pnl = pending['shares'] * 0.01 if result else -pending['shares'] * 0.99
                                     event_type = "CAPTURE_99C_WIN" if result else "CAPTURE_99C_LOSS"
@@ -4316,17 +4915,25 @@ def main():
                             print(f"[{ts()}] ⏳ Still pending: {len(pending_99c_resolutions)} unresolved 99c trades")
 
                     # Check gas balance and alert if low
-                    gas_balance = check_gas_and_alert()
+                    try:
+                        gas_balance = _gas_future.result()
+                    except Exception as e:
+                        print(f"[{ts()}] GAS_CHECK_ERROR: {e}")
+                        gas_balance = None
                     if gas_balance is not None:
                         days_left = gas_balance / (47 * 0.0268)
                         gas_status = "OK" if gas_balance >= GAS_LOW_THRESHOLD else ("LOW" if gas_balance >= GAS_CRITICAL_THRESHOLD else "CRITICAL")
                         print(f"[{ts()}] ⛽ Gas: {gas_balance:.4f} MATIC ({days_left:.1f} days) [{gas_status}]")
 
                     # Daily balance snapshot (once per EST day)
-                    check_and_log_balance()
+                    try:
+                        _daily_future.result()
+                    except Exception as e:
+                        print(f"[{ts()}] BALANCE_SNAPSHOT_ERROR: {e}")
 
                     # Portfolio balance for dynamic trade sizing
-                    _pos_val, _usdc_val = get_portfolio_balance()
+                    _pos_val, _usdc_val = _balance_future.result()
+                    cached_market = _market_future.result()
                     cached_portfolio_total = _pos_val + _usdc_val
                     if cached_portfolio_total > 0:
                         print(f"[{ts()}] 💰 Balance snapshot: ${cached_portfolio_total:.2f} (positions: ${_pos_val:.2f}, USDC: ${_usdc_val:.2f})")
@@ -4367,7 +4974,8 @@ def main():
                         time.sleep(0.5)
                         continue
 
-                books = get_order_books(cached_market)
+                # Live WS book when fresh; REST on the first tick of a window or if the feed lags
+                books = get_live_books(cached_market)
                 if not books:
                     error_count += 1
                     time.sleep(0.5)
@@ -4411,14 +5019,15 @@ def main():
                 # PERIODIC ORDER HEALTH CHECK - detect fills from order status
                 if window_state.get('current_arb_orders'):
                     arb = window_state['current_arb_orders']
-                    if arb.get('up_id'):
-                        up_status = get_order_status(arb['up_id'])
+                    up_future, down_future = check_both_orders_async(arb.get('up_id'), arb.get('down_id'))
+                    if up_future:
+                        up_status = _future_result(up_future, dict(_ORDER_STATUS_ERROR))
                         if up_status.get('filled', 0) > window_state['filled_up_shares']:
                             print(f"[{ts()}] ORDER_FILL_DETECTED: UP {up_status['filled']:.1f} shares")
                             window_state['filled_up_shares'] = up_status['filled']
                             window_state['avg_up_price_paid'] = arb.get('bid_up', 0)
-                    if arb.get('down_id'):
-                        down_status = get_order_status(arb['down_id'])
+                    if down_future:
+                        down_status = _future_result(down_future, dict(_ORDER_STATUS_ERROR))
                         if down_status.get('filled', 0) > window_state['filled_down_shares']:
                             print(f"[{ts()}] ORDER_FILL_DETECTED: DOWN {down_status['filled']:.1f} shares")
                             window_state['filled_down_shares'] = down_status['filled']
@@ -4428,8 +5037,9 @@ def main():
                 # Confidence-based 99c capture: only bet when confidence >= 95%
                 # v1.46: Skip when trading halted
                 if CAPTURE_99C_ENABLED and books and not window_state.get('capture_99c_used') and not trading_halted:
-                    ask_up = float(books['up_asks'][0]['price']) if books.get('up_asks') else 0.50
-                    ask_down = float(books['down_asks'][0]['price']) if books.get('down_asks') else 0.50
+                    top = book_top(books)  # 0.0 = empty side
+                    ask_up = top.up_ask or 0.50
+                    ask_down = top.down_ask or 0.50
                     capture = check_99c_capture_opportunity(ask_up, ask_down, remaining_secs)
                     if capture:
                         # v1.62 Trend Guard: check multi-window BTC trend before entering
@@ -4513,7 +5123,6 @@ def main():
                                                        _shares=sell_shares, _side=side,
                                                        _ws=_ws_ref, _wid=_window_id_at_fill):
                                 """Background thread: retry profit lock sell until success, exit, or window change."""
-                                from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
                                 MAX_RETRIES = 60  # 60 × 0.5s = 30 seconds max
                                 for attempt in range(1, MAX_RETRIES + 1):
                                     # Stop if window changed (kills zombie threads)
@@ -4558,7 +5167,6 @@ def main():
                                     time.sleep(0.5)
                                 print(f"[{ts()}] 🔒 PROFIT_LOCK[BG]: Gave up after {MAX_RETRIES} attempts (30s)")
 
-                            import threading
                             threading.Thread(target=_profit_lock_bg_thread, daemon=True).start()
 
                 # === 60¢ HARD STOP CHECK (v1.34) ===
@@ -4648,10 +5256,7 @@ def main():
 
                     # Get OB imbalance for our side
                     if ORDERBOOK_ANALYZER_AVAILABLE and books:
-                        ob_result = orderbook_analyzer.analyze(
-                            books.get('up_bids', []), books.get('up_asks', []),
-                            books.get('down_bids', []), books.get('down_asks', [])
-                        )
+                        ob_result = orderbook_analyzer.analyze_books(books)
                         imb = ob_result.get('up_imbalance', 0) if capture_side == "UP" else ob_result.get('down_imbalance', 0)
 
                         # Track consecutive negative ticks
@@ -4679,13 +5284,11 @@ def main():
                         current_ask = float(books['down_asks'][0]['price']) if books.get('down_asks') else 0
                     current_confidence, _ = calculate_99c_confidence(current_ask, remaining_secs)
 
-                    # Get order book imbalance for our side
+                    # Get order book imbalance for our side (analyze_books also records the
+                    # analyzer history reading this tick, which the trend window counts on)
                     our_imbalance = 0.0
                     if ORDERBOOK_ANALYZER_AVAILABLE:
-                        ob_result = orderbook_analyzer.analyze(
-                            books.get('up_bids', []), books.get('up_asks', []),
-                            books.get('down_bids', []), books.get('down_asks', [])
-                        )
+                        ob_result = orderbook_analyzer.analyze_books(books)
                         our_imbalance = ob_result['up_imbalance'] if bet_side == "UP" else ob_result['down_imbalance']
 
                     # Get opponent ask price
@@ -4876,8 +5479,8 @@ def main():
 
         if window_state:
             trades_log.append(window_state)
-        save_trades()
-        print("Trades saved to trades_smart.json")
+        flush_trades()
+        print(f"Trades saved to {TRADES_FILE}")
 
 if __name__ == "__main__":
     main()